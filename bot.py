@@ -2,10 +2,17 @@ import os
 import re
 import time
 import json
+import random
 import asyncio
 import logging
-import tempfile
+import functools
+import io
+import copy
+import hashlib
+import threading
 import subprocess
+from collections import deque, OrderedDict
+from itertools import zip_longest
 from datetime import datetime, timedelta
 
 import discord
@@ -13,10 +20,17 @@ import gspread
 import pymysql
 from gspread.utils import rowcol_to_a1
 import google.generativeai as genai
-from google.api_core.exceptions import ResourceExhausted
+from google.api_core.exceptions import ResourceExhausted, ServerError
+from google.auth.exceptions import RefreshError
 from google.oauth2.service_account import Credentials
 from PIL import Image
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # Fallback auf stdlib json
+    json_loads = json.loads
+
 # ── Logging ───────────────────────────────────────────────────────────────────
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 log = logging.getLogger(__name__)
@@ -64,6 +78,7 @@ def _load_sheet_id_from_db() -> str:
 GOOGLE_SHEET_ID = _load_sheet_id_from_db()
 GEMINI_2ND_RUN         = int(os.environ.get("GEMINI_2ND_RUN", "0"))
 GEMINI_BACKOFF_MINUTES = int(os.environ.get("GEMINI_BACKOFF_MINUTES", "60"))
+LIST_CACHE_TTL         = int(os.environ.get("LIST_CACHE_TTL", "600"))  # Sekunden
 SPECIAL_EVENT_RAW       = os.environ.get("SPECIAL_EVENT", "")
 REGISTRATION_END_TIME   = os.environ.get("REGISTRATION_END_TIME", "20:45")  # Format HH:MM
 SPECIAL_EVENTS     = [s.strip().lower() for s in SPECIAL_EVENT_RAW.split(";") if s.strip()]
@@ -71,18 +86,45 @@ SPECIAL_EVENTS     = [s.strip().lower() for s in SPECIAL_EVENT_RAW.split(";") if
 async def run_sync(func, *args, **kwargs):
     """Fuehrt synchrone Funktion in Thread-Pool aus um asyncio-Loop nicht zu blockieren."""
     loop = asyncio.get_event_loop()
-    import functools
     return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
 
 
-POLL_INTERVAL = 15
+IMAGE_INTERVAL = 15  # Mindestabstand (s) zwischen Bildern eines Posts (Gemini-RPM)
+GEMINI_CONCURRENCY = int(os.environ.get("GEMINI_CONCURRENCY", "4"))  # max. parallele Auswertungen
+GEMINI_RPM         = int(os.environ.get("GEMINI_RPM", "10"))           # lokales Limit Aufrufe/Minute
+GEMINI_TARGET_LATENCY = float(os.environ.get("GEMINI_TARGET_LATENCY", "30"))  # Sekunden pro Bild
+GEMINI_IMAGE_MAX_EDGE = int(os.environ.get("GEMINI_IMAGE_MAX_EDGE", "1280"))  # laengste Kante (px)
+GEMINI_JPEG_QUALITY   = int(os.environ.get("GEMINI_JPEG_QUALITY", "85"))
+ATTACHMENT_CACHE_SIZE = int(os.environ.get("ATTACHMENT_CACHE_SIZE", "32"))  # Bilder im Speicher
+GEMINI_CACHE_SIZE     = int(os.environ.get("GEMINI_CACHE_SIZE", "64"))  # Auswertungen im Speicher
 DONE_EMOJI    = "\u2705"
 ERROR_EMOJI   = "\u274c"
 MANUAL_EMOJI  = "\u270d\ufe0f"  # ✍️ manuell
 
+# ── Regex-Muster (einmalig kompiliert) ───────────────────────────────────────
+_DIGITS_RE     = re.compile(r"[^\d]")
+_DNF_RE        = re.compile(r"^[-:,\.]+$")
+_LAPS_RE       = re.compile(r"^(\d+)\s*(Runden?|Laps?)$", re.IGNORECASE)
+_TIME_SPLIT_RE = re.compile(r"[:.]")
+_RACE_EMBED_RE = re.compile(r"^\*\*Race (\d+)")
+_RETRY_DELAY_RE = re.compile(r"retry_?delay[\"'\s:{]*(?:seconds:\s*)?(\d+(?:\.\d+)?)",
+                             re.IGNORECASE)
+_REPLY_CMD_RE  = re.compile(r"(grid\s+\w+|retry)", re.IGNORECASE)
+_GRID_REPLY_RE = re.compile(r"grid\s+(\w+)(?:\s+seite\s+(\d+))?", re.IGNORECASE)
+
+# repair_gemini_json
+_REPAIR_MISSING_BRACE_RE    = re.compile(r'("|\ d)(\s*\n\s*),(\s*\{)')
+_REPAIR_TRAILING_COMMA_RE   = re.compile(r",\s*([}\\]])")
+_REPAIR_SINGLE_QUOTE_KEY_RE = re.compile(r"'([^'\n]+)'(\s*:)")
+_REPAIR_BACKSLASH_RE        = re.compile(r'\\(?!["\\/bfnrtu])')
+
 NUMBER_EMOJIS = ["1\ufe0f\u20e3", "2\ufe0f\u20e3", "3\ufe0f\u20e3", "4\ufe0f\u20e3",
                  "5\ufe0f\u20e3", "6\ufe0f\u20e3", "7\ufe0f\u20e3", "8\ufe0f\u20e3",
                  "9\ufe0f\u20e3", "\U0001f51f"]
+# Endzustaende eines Posts (fertig, Fehler, manuell)
+TERMINAL_EMOJIS    = frozenset((DONE_EMOJI, ERROR_EMOJI, MANUAL_EMOJI))
+NUMBER_EMOJI_SET   = frozenset(NUMBER_EMOJIS)
+NUMBER_EMOJI_INDEX = {e: i for i, e in enumerate(NUMBER_EMOJIS)}
 
 # Gemini-Quota-Sperre
 gemini_blocked_until = None
@@ -100,8 +142,39 @@ discord_id_map:    dict = {}  # {discord_id: (tabellenname, team)}
 class GeminiQuotaError(Exception):
     pass
 
+class BoundedIdSet:
+    """Set von Message-IDs mit LRU-Verdraengung, waechst nicht unbegrenzt."""
+
+    def __init__(self, maxlen=1000):
+        self.maxlen = maxlen
+        self._ids   = OrderedDict()
+
+    def add(self, msg_id):
+        self._ids[msg_id] = None
+        self._ids.move_to_end(msg_id)
+        while len(self._ids) > self.maxlen:
+            self._ids.popitem(last=False)
+
+    def discard(self, msg_id):
+        self._ids.pop(msg_id, None)
+
+    def __contains__(self, msg_id):
+        return msg_id in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
 # Nachrichten-IDs die gerade verarbeitet werden (verhindert Doppel-Scan)
-processing_ids: set = set()
+processing_ids = BoundedIdSet(1000)
+# User-Posts die abgeschlossen sind (DONE/ERROR/MANUAL) - spart fetch_message beim Abgleich
+finished_ids   = BoundedIdSet(1000)
+
+# Eigene User-ID des Bots (wird in on_ready gesetzt, danach konstant)
+BOT_USER_ID = None
+
+# Alles was Sheet-Bloecke und Channel-Reihenfolge veraendert
+# (Ergebnisse schreiben, Posten, Befehle) laeuft exklusiv
+channel_lock = asyncio.Lock()
 
 # Grid-Snapshot: {fahrername_lower: grid_label} - wird montags um REGISTRATION_END_TIME erstellt
 grid_snapshot: dict = {}
@@ -127,6 +200,11 @@ PAGE_EMOJI = {
 ALL_GRID_EMOJIS = set(GRID_EMOJI.values())
 ALL_PAGE_EMOJIS = set(PAGE_EMOJI.values())
 ALL_MARKER_EMOJIS = ALL_GRID_EMOJIS | ALL_PAGE_EMOJIS
+# Umkehr-Lookups Emoji -> Grid/Seite (bei doppeltem 🔵 gewinnt der erste Eintrag "2")
+EMOJI_TO_GRID = {}
+for _gl, _ge in GRID_EMOJI.items():
+    EMOJI_TO_GRID.setdefault(_ge, _gl)
+EMOJI_TO_PAGE = {pe: pg for pg, pe in PAGE_EMOJI.items()}
 
 def get_marker_emojis(grid_label, page):
     """Gibt (grid_emoji, page_emoji) fuer ein Grid/Seite-Paar zurueck."""
@@ -145,14 +223,12 @@ def parse_meta_from_reactions(reactions, bot_id):
         # daher pruefen wir einfach ob reaction.me True ist
         if not reaction.me:
             continue
-        for gl, ge in GRID_EMOJI.items():
-            if emoji_str == ge and found_grid is None:
-                found_grid = gl
-        for pg, pe in PAGE_EMOJI.items():
-            if emoji_str == pe:
-                found_page = pg
-    if found_grid is not None and found_page is not None:
-        return {"grid": found_grid, "page": found_page}
+        if found_grid is None:
+            found_grid = EMOJI_TO_GRID.get(emoji_str)
+        if found_page is None:
+            found_page = EMOJI_TO_PAGE.get(emoji_str)
+        if found_grid is not None and found_page is not None:
+            return {"grid": found_grid, "page": found_page}
     return None
 
 # ── Sheet-Layout ───────────────────────────────────────────────────────────────
@@ -193,6 +269,19 @@ REL = {
     "fl_time":    5,
 }
 
+# Spaltenoffsets als Konstanten fuer Hot Paths (kein Dict-Lookup pro Zelle)
+REL_GRID_LABEL = REL["grid_label"]
+REL_POSITION   = REL["position"]
+REL_DRIVER     = REL["driver"]
+REL_TEAM       = REL["team"]
+REL_CAR        = REL["car"]
+REL_RACETIME   = REL["racetime"]
+REL_LAPS       = REL["laps"]
+REL_PENALTY    = REL["penalty"]
+REL_TOTALTIME  = REL["totaltime"]
+REL_FL_DRIVER  = REL["fl_driver"]
+REL_FL_TIME    = REL["fl_time"]
+
 # ── Sheet-Koordinaten ─────────────────────────────────────────────────────────
 def col_start(rennen):
     return FIRST_COL_RACE1 + (rennen - 1) * COL_OFFSET_PER_RACE
@@ -205,115 +294,207 @@ def get_cell(rennen, block, position, field):
     r = row_start(block) + (position - 1)
     return r, c
 
+def get_cell_col(rennen, field_off):
+    return col_start(rennen) + field_off
+
 def get_grid_label_cell(rennen, block):
-    return row_start(block), col_start(rennen) + REL["grid_label"]
+    return row_start(block), col_start(rennen) + REL_GRID_LABEL
+
+def range_val(values, r, c):
+    """Liest Zelle (r, c) relativ zum Bereichsanfang aus einem batch_get-Ergebnis."""
+    try:
+        return str(values[r][c]).strip()
+    except IndexError:
+        return ""
+
+def by_position(fahrer_list):
+    """Ordnet Fahrer nach Position per Bucket (Positionen 1..ROW_OFFSET_PER_GRID).
+    Bei doppelten oder ungueltigen Positionen Fallback auf Sortierung."""
+    slots = [None] * ROW_OFFSET_PER_GRID
+    for f in fahrer_list:
+        pos = int(f["position"])
+        if not 1 <= pos <= ROW_OFFSET_PER_GRID or slots[pos - 1] is not None:
+            return sorted(fahrer_list, key=lambda x: int(x["position"]))
+        slots[pos - 1] = f
+    return [f for f in slots if f is not None]
 
 # ── Google Sheets Client ──────────────────────────────────────────────────────
+# Client, Arbeitsmappe und Tabellenblaetter werden einmalig erstellt und
+# wiederverwendet (kein erneutes OAuth/Metadaten-Lookup pro Aufruf).
+_gs_client   = None
+_gs_workbook = None
+_ws_cache:   dict = {}  # {blattname: Worksheet}
+
 def get_gspread_client():
-    creds_value = GOOGLE_CREDENTIALS
-    if os.path.isfile(creds_value):
-        with open(creds_value) as f:
-            creds_dict = json.load(f)
-    else:
-        creds_dict = json.loads(creds_value)
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive",
-    ]
-    creds = Credentials.from_service_account_info(creds_dict, scopes=scopes)
-    return gspread.authorize(creds)
+    global _gs_client
+    if _gs_client is None:
+        creds_value = GOOGLE_CREDENTIALS
+        if os.path.isfile(creds_value):
+            with open(creds_value) as f:
+                creds_dict = json.load(f)
+        else:
+            creds_dict = json.loads(creds_value)
+        scopes = [
+            "https://www.googleapis.com/auth/spreadsheets",
+            "https://www.googleapis.com/auth/drive",
+        ]
+        creds      = Credentials.from_service_account_info(creds_dict, scopes=scopes)
+        _gs_client = gspread.authorize(creds)
+        log.info("gspread-Client autorisiert.")
+    return _gs_client
+
+def reset_gspread_cache():
+    """Verwirft Client, Arbeitsmappe und Blatt-Handles (naechster Zugriff autorisiert neu)."""
+    global _gs_client, _gs_workbook
+    _gs_client   = None
+    _gs_workbook = None
+    _ws_cache.clear()
+
+def get_workbook():
+    """Gibt die gesamte Arbeitsmappe zurueck."""
+    global _gs_workbook
+    if _gs_workbook is None:
+        _gs_workbook = get_gspread_client().open_by_key(GOOGLE_SHEET_ID)
+    return _gs_workbook
+
+def get_ws(name):
+    """Gibt Tabellenblatt `name` zurueck (gecacht)."""
+    ws = _ws_cache.get(name)
+    if ws is None:
+        ws = get_workbook().worksheet(name)
+        _ws_cache[name] = ws
+    return ws
 
 def get_sheet():
     """Gibt Tabellenblatt 'T' zurueck."""
-    return get_gspread_client().open_by_key(GOOGLE_SHEET_ID).worksheet("T")
+    return get_ws("T")
 
-def get_workbook():
-    """Gibt die gesamte Arbeitsmappe zurueck."""
-    return get_gspread_client().open_by_key(GOOGLE_SHEET_ID)
+def is_gspread_auth_error(e):
+    """True bei abgelaufener/ungueltiger Autorisierung (Cache muss verworfen werden)."""
+    if isinstance(e, RefreshError):
+        return True
+    return (isinstance(e, gspread.exceptions.APIError)
+            and getattr(e, "code", None) in (401, 403))
+
+_gs_retry_state = threading.local()
+
+def gspread_retrying():
+    """True, solange gspread_retry im aktuellen Thread die Wiederholung ausfuehrt."""
+    return getattr(_gs_retry_state, "active", False)
+
+def gspread_retry(func):
+    """Bei Auth-Fehler: Cache verwerfen und Aufruf einmal wiederholen.
+    Ist das erste Argument ein Worksheet, wird es durch ein frisches Handle ersetzt.
+    Helfer mit eigenem Fallback reichen Auth-Fehler nur beim ersten Versuch weiter
+    (siehe gspread_retrying), beim zweiten greift ihr Fallback."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if not is_gspread_auth_error(e) or gspread_retrying():
+                raise
+            log.warning(f"gspread Auth-Fehler in {func.__name__} ({e}), autorisiere neu...")
+            reset_gspread_cache()
+            if args and isinstance(args[0], gspread.Worksheet):
+                args = (get_ws(args[0].title),) + args[1:]
+            _gs_retry_state.active = True
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _gs_retry_state.active = False
+    return wrapper
 
 # ── Fahrzeug- und Fahrerliste laden ──────────────────────────────────────────
-def load_car_list():
+# Beide Listen werden fuer LIST_CACHE_TTL Sekunden zwischengespeichert,
+# !update und !check laden immer frisch (force=True).
+_car_list_loaded_at = 0.0
+_driver_cache       = {"maps": None, "ts": 0.0}
+
+@gspread_retry
+def load_car_list(force=False):
     """Laedt Fahrzeugliste aus DB_tech und Uebersetzungstabelle aus Car_Translate."""
-    global car_list, car_translate_map
+    global car_list, car_translate_map, _car_list_loaded_at
+    if (not force and car_list
+            and time.monotonic() - _car_list_loaded_at < LIST_CACHE_TTL):
+        return
     try:
-        wb    = get_workbook()
-        sheet = wb.worksheet("DB_tech")
+        sheet = get_ws("DB_tech")
         vals  = sheet.get("R8:R300")
-        car_list = [row[0].strip() for row in vals if row and row[0].strip()]
+        car_list = [name for row in vals if row and (name := row[0].strip())]
         if not car_list:
             log.warning("Fahrzeugliste ist leer! Bitte DB_tech pruefen (Spalte R ab Zeile 8).")
         else:
             log.info(f"Fahrzeugliste geladen: {len(car_list)} Eintraege")
     except Exception as e:
+        if is_gspread_auth_error(e):
+            if not gspread_retrying():
+                raise  # gspread_retry autorisiert neu und wiederholt einmal
+            reset_gspread_cache()
         log.error(f"KRITISCH: Fahrzeugliste konnte nicht geladen werden: {e}")
         car_list = []
 
     # Car_Translate laden: Spalte A = Tabellenname, Spalte B = Spielname
     for versuch in range(1, 6):
         try:
-            wb    = get_workbook()
-            sheet = wb.worksheet("Car_Translate")
+            sheet = get_ws("Car_Translate")
             rows  = sheet.get("A2:B1000")  # Zeile 1 = Ueberschrift
-            car_translate_map = {}
-            for row in rows:
-                tabellenname = row[0].strip() if len(row) > 0 else ""
-                spielname    = row[1].strip() if len(row) > 1 else ""
-                if tabellenname and spielname:
-                    car_translate_map[spielname.lower()] = tabellenname
+            # Zeilen auf 2 Spalten normalisieren, einmal strippen, Schluessel lowercase
+            pairs = ((a.strip(), b.strip()) for a, b in ((row + ["", ""])[:2] for row in rows))
+            car_translate_map = {spiel.casefold(): tab for tab, spiel in pairs if tab and spiel}
             log.info(f"Car_Translate geladen: {len(car_translate_map)} Eintraege")
+            if car_list:
+                _car_list_loaded_at = time.monotonic()
             break
         except Exception as e:
             if "Car_Translate" in str(e) or "worksheet" in str(e).lower() or "not found" in str(e).lower():
                 log.info("Car_Translate Tabellenblatt nicht vorhanden - wird ignoriert.")
                 car_translate_map = {}
+                if car_list:
+                    _car_list_loaded_at = time.monotonic()
                 break
+            if is_gspread_auth_error(e):
+                reset_gspread_cache()
             if versuch < 5:
                 log.warning(f"Car_Translate Versuch {versuch}/5 fehlgeschlagen: {e} - warte 2s")
-                import time; time.sleep(2)
+                time.sleep(2)
             else:
                 log.error(f"Car_Translate konnte nach 5 Versuchen nicht geladen werden: {e}")
                 car_translate_map = {}
 
-def load_driver_list():
-    """Laedt Fahrerliste aus DB_drvr.
+@gspread_retry
+def load_driver_list(force=False):
+    """Laedt Fahrerliste aus DB_drvr (gecacht fuer LIST_CACHE_TTL Sekunden).
     Spalte C = Tabellenname, Spalte K = Team, Spalte DB = GT7-Spielname, Spalte DC = Discord-ID.
     Gibt drei Dicts zurueck:
       driver_map:     {lower_tabellenname: (tabellenname, team, discord_id_or_None)}
       gt7_name_map:   {lower_gt7name:      (tabellenname, team, discord_id_or_None)}
       discord_id_map: {discord_id:          (tabellenname, team)}
     """
+    if (not force and _driver_cache["maps"]
+            and time.monotonic() - _driver_cache["ts"] < LIST_CACHE_TTL):
+        return _driver_cache["maps"]
     try:
-        wb    = get_workbook()
-        sheet = wb.worksheet("DB_drvr")
-
-        # Spalte C+K: Tabellenname und Team
-        rows_ck  = sheet.get("C5:K200")
-        # Spalte DB: GT7-Spielnamen
-        rows_db  = sheet.get("DB5:DB200")
-        # Spalte DC (107): Discord-IDs
-        rows_dc  = sheet.get("DC5:DC200")
-
-        driver_map     = {}
-        gt7_name_map   = {}
-        discord_id_map = {}
-
-        for i, row in enumerate(rows_ck):
-            name = row[0].strip() if len(row) > 0 else ""
-            team = row[8].strip() if len(row) > 8 else ""
-
-            dc_row     = rows_dc[i] if i < len(rows_dc) else []
-            discord_id = dc_row[0].strip() if dc_row and dc_row[0].strip() else None
-
-            if name:
-                driver_map[name.lower()] = (name, team, discord_id)
-                if discord_id:
-                    discord_id_map[discord_id] = (name, team)
-
-            # GT7-Name aus Spalte DB, gleiche Zeile
-            gt7_row  = rows_db[i] if i < len(rows_db) else []
-            gt7_name = gt7_row[0].strip() if gt7_row else ""
-            if gt7_name and name:
-                gt7_name_map[gt7_name.lower()] = (name, team, discord_id)
+        sheet = get_ws("DB_drvr")
+
+        # C+K: Tabellenname und Team, DB: GT7-Spielnamen, DC (107): Discord-IDs
+        rows_ck, rows_db, rows_dc = sheet.batch_get(["C5:K200", "DB5:DB200", "DC5:DC200"])
+
+        # Ein Durchlauf ueber alle drei Spalten: (name, team, gt7_name, discord_id)
+        # je Zeile; Zeilen werden vorher auf feste Breite gebracht (keine len()-Pruefungen)
+        entries = [
+            (ck[0].strip(), ck[8].strip(), db[0].strip(), dc[0].strip() or None)
+            for ck, db, dc in (
+                ((ck + [""] * 9)[:9], (db + [""])[:1], (dc + [""])[:1])
+                for ck, db, dc in zip_longest(rows_ck, rows_db, rows_dc, fillvalue=[])
+            )
+        ]
+        driver_map     = {name.casefold(): (name, team, did)
+                          for name, team, _, did in entries if name}
+        gt7_name_map   = {gt7.casefold(): (name, team, did)
+                          for name, team, gt7, did in entries if name and gt7}
+        discord_id_map = {did: (name, team)
+                          for name, team, _, did in entries if name and did}
 
         if not driver_map:
             log.warning("Fahrerliste ist leer! Bitte DB_drvr pruefen (Spalte C ab Zeile 5).")
@@ -321,24 +502,39 @@ def load_driver_list():
             dc_count = sum(1 for v in driver_map.values() if v[2])
             log.info(f"Fahrerliste geladen: {len(driver_map)} Eintraege, "
                      f"{len(gt7_name_map)} GT7-Namen, {dc_count} Discord-IDs")
+            _driver_cache["maps"] = (driver_map, gt7_name_map, discord_id_map)
+            _driver_cache["ts"]   = time.monotonic()
         return driver_map, gt7_name_map, discord_id_map
     except Exception as e:
+        if is_gspread_auth_error(e):
+            if not gspread_retrying():
+                raise  # gspread_retry autorisiert neu und wiederholt einmal
+            reset_gspread_cache()
         log.error(f"KRITISCH: Fahrerliste konnte nicht geladen werden: {e}")
         return {}, {}, {}
 
+async def reload_lists(force=False):
+    """Laedt Fahrzeug- und Fahrerliste parallel in zwei Threads.
+    Gibt (driver_map, gt7_name_map, discord_id_map) zurueck."""
+    _, maps = await asyncio.gather(run_sync(load_car_list, force=force),
+                                   run_sync(load_driver_list, force=force))
+    return maps
+
 # ── Grid-Block Aufloesung ─────────────────────────────────────────────────────
 def read_grid_label(sheet, rennen, block):
     r, c = get_grid_label_cell(rennen, block)
     val  = sheet.cell(r, c).value
     return (val or "").strip().lower()
 
-def resolve_block(sheet, rennen, grid_label):
+def resolve_block(sheet, rennen, grid_label, label_block2=None):
+    """label_block2: bereits gelesenes Grid-Label von Block 2 (lowercase), sonst wird es gelesen."""
     gl = grid_label.strip().lower()
     if gl == "1":
         return 0
     if gl in ("2", "2a"):
         return 1
-    label_block2 = read_grid_label(sheet, rennen, 2)
+    if label_block2 is None:
+        label_block2 = read_grid_label(sheet, rennen, 2)
     if gl == "3":
         return 3 if label_block2 == "2b" else 2
     if gl == "2b":
@@ -350,66 +546,66 @@ def resolve_block(sheet, rennen, grid_label):
     return 2
 
 def shift_block(sheet, rennen, src_block, dst_block):
-    """Verschiebt einen Grid-Block per Batch-Read und Batch-Write (minimal API-Calls)."""
-    # Grid-Label verschieben
+    """Verschiebt einen Grid-Block: ein Batch-Read und ein Batch-Write (Ziel fuellen, Quelle leeren)."""
     sr, sc = get_grid_label_cell(rennen, src_block)
     dr, dc = get_grid_label_cell(rennen, dst_block)
-    label_val = sheet.cell(sr, sc).value or ""
-
-    # Alle Daten des src_blocks in einem Aufruf lesen
-    cs = col_start(rennen)
-    r_start = row_start(src_block)
-    r_end   = r_start + 19
-    src_range = (rowcol_to_a1(r_start, cs + REL["driver"]) + ":" +
-                 rowcol_to_a1(r_end,   cs + REL["laps"]))
-    src_data = sheet.get(src_range)
-
-    # Batch-Update fuer Ziel-Block aufbauen
-    dst_r_start = row_start(dst_block)
-    updates = []
-    # Grid-Label
-    updates.append({"range": rowcol_to_a1(dr, dc), "values": [[label_val]]})
-    updates.append({"range": rowcol_to_a1(sr, sc), "values": [[""]]})
-    # Datenzeilen
-    for i, row in enumerate(src_data):
-        for j, field in enumerate(("driver", "team", "car", "racetime", "laps")):
-            val = row[j] if j < len(row) else ""
-            dr2, dc2 = get_cell(rennen, dst_block, i + 1, field if field != "team" else "driver")
-            # team hat keinen eigenen REL-Key in get_cell, manuell:
-        # Gesamte Zeile als Range
-        dst_r = dst_r_start + i
-        src_r = r_start + i
-        n_cols = REL["laps"] - REL["driver"] + 1
-        dst_range = (rowcol_to_a1(dst_r, cs + REL["driver"]) + ":" +
-                     rowcol_to_a1(dst_r, cs + REL["laps"]))
-        src_range_row = (rowcol_to_a1(src_r, cs + REL["driver"]) + ":" +
-                         rowcol_to_a1(src_r, cs + REL["laps"]))
-        row_vals = row + [""] * (n_cols - len(row)) if len(row) < n_cols else row[:n_cols]
-        updates.append({"range": dst_range, "values": [row_vals]})
-        updates.append({"range": src_range_row, "values": [[""]*n_cols]})
-
-    sheet.batch_update(updates)
-    log.info(f"shift_block: Block {src_block} -> {dst_block} in {len(updates)} Batch-Updates")
+    cs     = col_start(rennen)
+    n_cols = REL_LAPS - REL_DRIVER + 1
+
+    src_label = rowcol_to_a1(sr, sc)
+    src_range = (rowcol_to_a1(row_start(src_block),      cs + REL_DRIVER) + ":" +
+                 rowcol_to_a1(row_start(src_block) + 19, cs + REL_LAPS))
+    dst_range = (rowcol_to_a1(row_start(dst_block),      cs + REL_DRIVER) + ":" +
+                 rowcol_to_a1(row_start(dst_block) + 19, cs + REL_LAPS))
+
+    # Grid-Label und alle Daten des src_blocks in einem Aufruf lesen
+    # (unformatiert, damit Zeiten/Runden als Zahlen zurueckgeschrieben werden)
+    label_vals, src_data = sheet.batch_get([src_label, src_range],
+                                           value_render_option="UNFORMATTED_VALUE")
+    label_val = range_val(label_vals, 0, 0)
+
+    # Zielblock als ein Rechteck (20 x n_cols) schreiben
+    rows = [(list(row) + [""] * n_cols)[:n_cols] for row in src_data]
+    rows += [[""] * n_cols] * (20 - len(rows))
+    sheet.batch_update([
+        {"range": rowcol_to_a1(dr, dc), "values": [[label_val]]},
+        {"range": dst_range,            "values": rows},
+        {"range": src_label,            "values": [[""]]},
+        {"range": src_range,            "values": [[""] * n_cols] * 20},
+    ])
+    log.info(f"shift_block: Block {src_block} -> {dst_block} ({len(src_data)} Zeilen)")
 
 # ── Zeit-Formatierung ─────────────────────────────────────────────────────────
+_TIME_SEPARATORS = str.maketrans("", "", ":,.' \u00a0-+")
+
+def only_digits(text):
+    """Entfernt Trennzeichen aus Zeitangaben per str.translate.
+    Regex nur als Fallback, wenn danach noch unerwartete Zeichen uebrig sind."""
+    digits = text.translate(_TIME_SEPARATORS)
+    if not digits or digits.isdecimal():
+        return digits
+    return _DIGITS_RE.sub("", digits)
+
+@functools.lru_cache(maxsize=512)
 def clean_time(zeit):
-    """Gibt (racetime_int_or_None, laps_int_or_None) zurueck. Zeiten als Integer (kein Apostroph)."""
+    """Gibt (racetime_int_or_None, laps_int_or_None) zurueck. Zeiten als Integer (kein Apostroph).
+    Gecacht: validate_deltas und write_results parsen dieselben Zeit-Strings."""
     if not zeit:
         return None, None
     z = zeit.strip()
-    if z.upper() == "DNF" or re.match(r"^[-:,\.]+$", z):
+    if z.upper() == "DNF" or _DNF_RE.match(z):
         return None, None
-    m = re.match(r"^(\d+)\s*(Runden?|Laps?)$", z, re.IGNORECASE)
+    m = _LAPS_RE.match(z)
     if m:
         return None, int(m.group(1))
-    digits = re.sub(r"[^\d]", "", z)
+    digits = only_digits(z)
     return (int(digits) if digits else None), None
 
 # ── Delta-Validierung ─────────────────────────────────────────────────────────
 def validate_deltas(fahrer_list):
     errors     = []
     prev_delta = None
-    for f in sorted(fahrer_list, key=lambda x: x["position"]):
+    for f in by_position(fahrer_list):
         pos = f["position"]
         if pos == 1:
             continue
@@ -425,42 +621,139 @@ def validate_deltas(fahrer_list):
 GREY2 = {"red": 0.8, "green": 0.8, "blue": 0.8}  # Hellgrau 2 in Google Sheets
 RED   = {"red": 1.0, "green": 0.0, "blue": 0.0}
 
-def batch_format_cells(sheet, grey_cells, red_cells):
-    """Formatiert alle Zellen in einem einzigen API-Aufruf statt einzeln."""
-    formats = []
-    for (row, col) in grey_cells:
-        formats.append({
-            "range": rowcol_to_a1(row, col),
-            "format": {"textFormat": {"foregroundColor": GREY2}}
-        })
-    for (row, col) in red_cells:
-        formats.append({
-            "range": rowcol_to_a1(row, col),
-            "format": {"textFormat": {"foregroundColor": RED}}
-        })
-    if formats:
-        sheet.batch_format(formats)
+def cell_data(value=None, color=None):
+    """CellData und Feldmaske fuer Wert und/oder Textfarbe einer Zelle."""
+    cell   = {}
+    fields = []
+    if value is not None:
+        key = "numberValue" if isinstance(value, (int, float)) else "stringValue"
+        cell["userEnteredValue"] = {key: value}
+        fields.append("userEnteredValue")
+    if color is not None:
+        cell["userEnteredFormat"] = {"textFormat": {"foregroundColor": color}}
+        fields.append("userEnteredFormat.textFormat.foregroundColor")
+    return cell, ",".join(fields)
+
+def cell_requests(sheet_id, values, colors):
+    """updateCells-Requests fuer spreadsheets.batchUpdate aus {(row, col): wert} und
+    {(row, col): farbe}. Aufeinanderfolgende Zeilen einer Spalte mit gleicher Feldmaske
+    werden zu einem Request zusammengefasst (eine Maske pro Request, sonst wuerden
+    Zellen ohne Wert geleert). Nebeneinanderliegende Spalten mit gleicher Zeilenspanne
+    und Maske werden danach zu einem Rechteck verbunden."""
+    requests = []
+    run      = None  # {"row": erste Zeile, "col", "end": letzte Zeile, "fields", "rows"}
+    for r, c in sorted(set(values) | set(colors), key=lambda rc: (rc[1], rc[0])):
+        cell, fields = cell_data(values.get((r, c)), colors.get((r, c)))
+        if run and run["col"] == c and run["end"] == r - 1 and run["fields"] == fields:
+            run["rows"].append({"values": [cell]})
+            run["end"] = r
+            continue
+        if run:
+            requests.append(run)
+        run = {"row": r, "col": c, "end": r, "fields": fields, "rows": [{"values": [cell]}]}
+    if run:
+        requests.append(run)
+
+    # Spalten-Laeufe sind nach Spalte sortiert: direkt rechts anschliessende
+    # Laeufe mit gleicher Spanne und Maske an den Block anhaengen
+    blocks     = []
+    open_block = {}  # {(erste Zeile, letzte Zeile, maske): block}
+    for run in requests:
+        key   = (run["row"], run["end"], run["fields"])
+        block = open_block.get(key)
+        if block and block["last_col"] == run["col"] - 1:
+            for row, extra in zip(block["rows"], run["rows"]):
+                row["values"].extend(extra["values"])
+            block["last_col"] = run["col"]
+            continue
+        run["last_col"]  = run["col"]
+        open_block[key] = run
+        blocks.append(run)
+
+    return [{"updateCells": {
+        "rows":   block["rows"],
+        "fields": block["fields"],
+        "start":  {"sheetId": sheet_id, "rowIndex": block["row"] - 1,
+                   "columnIndex": block["col"] - 1},
+    }} for block in blocks]
 
 # ── Schnellste Runde ──────────────────────────────────────────────────────────
-def update_fastest_lap(sheet, rennen, new_driver, new_time_int):
-    c_driver    = col_start(rennen) + REL["fl_driver"]
-    c_time      = col_start(rennen) + REL["fl_time"]
-    current_val = sheet.cell(FASTEST_LAP_ROW, c_time).value
+def fastest_lap_cells(rennen, new_driver, new_time_int, current_val):
+    """Gibt {(row, col): wert} fuer FL-Fahrer/-Zeit zurueck, leer wenn bestehende Zeit schneller.
+    current_val: bereits gelesener Inhalt der FL-Zeit-Zelle."""
+    c_driver    = get_cell_col(rennen, REL_FL_DRIVER)
+    c_time      = get_cell_col(rennen, REL_FL_TIME)
     if current_val:
-        current_digits = re.sub(r"[^\d]", "", str(current_val))
+        current_digits = only_digits(str(current_val))
         if current_digits and int(current_digits) <= new_time_int:
-            return
+            return {}
     log.info(f"Neue schnellste Runde: {new_driver} - {new_time_int}")
-    sheet.update_cell(FASTEST_LAP_ROW, c_driver, new_driver)
-    sheet.update_cell(FASTEST_LAP_ROW, c_time,   new_time_int)  # Integer, kein Apostroph
+    return {
+        (FASTEST_LAP_ROW, c_driver): new_driver,
+        (FASTEST_LAP_ROW, c_time):   new_time_int,  # Integer, kein Apostroph
+    }
 
 # ── Gemini ────────────────────────────────────────────────────────────────────
 genai.configure(api_key=GEMINI_API_KEY)
 GEMINI_MODEL      = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
 gemini_model      = genai.GenerativeModel(GEMINI_MODEL)
-GENERATION_CONFIG = genai.GenerationConfig(temperature=0, max_output_tokens=8192)
+# Antwortschema entspricht dem "Format"-Block im Extraktions-Prompt. Mit
+# response_mime_type liefert Gemini reines JSON (keine Markdown-Zaeune).
+RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "rennen":    {"type": "integer"},
+        "grid":      {"type": "string", "nullable": True},
+        "kopfzeile": {"type": "string"},
+        "fahrer": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "position":    {"type": "integer"},
+                    "name":        {"type": "string"},
+                    "auto":        {"type": "string"},
+                    "zeit":        {"type": "string"},
+                    "beste_runde": {"type": "string"},
+                },
+                "required": ["position", "name", "auto", "zeit"],
+            },
+        },
+    },
+    "required": ["rennen", "grid", "fahrer"],
+}
+GENERATION_CONFIG = genai.GenerationConfig(temperature=0, max_output_tokens=8192,
+                                           response_mime_type="application/json",
+                                           response_schema=RESULT_SCHEMA)
+# Freitext-Antworten (Versions-Check)
+TEXT_GENERATION_CONFIG = genai.GenerationConfig(temperature=0, max_output_tokens=8192)
+
+# Prompt (und Modell mit Prompt als System-Instruktion) wird nur neu gebaut
+# wenn sich die Fahrerliste geaendert hat
+_prompt_cache = {"maps": None, "prompt": None, "model": None}
+
+# Nutzer-Turn pro Screenshot; die Regeln stehen in der System-Instruktion
+EXTRACT_USER_TURN = "Extrahiere die Ergebnisse aus diesem Screenshot als JSON."
 
 def build_extract_prompt():
+    """Gibt den Extraktions-Prompt mit aktueller Fahrerliste zurueck (gecacht)."""
+    if _prompt_cache["maps"] is not driver_map or _prompt_cache["prompt"] is None:
+        _prompt_cache["prompt"] = _build_extract_prompt()
+        _prompt_cache["maps"]   = driver_map
+        _prompt_cache["model"]  = None
+    return _prompt_cache["prompt"]
+
+def extract_model():
+    """GenerativeModel mit dem Extraktions-Prompt als system_instruction.
+    Gleichbleibender Prompt-Praefix erlaubt implizites Caching auf Gemini-Seite."""
+    prompt = build_extract_prompt()
+    model  = _prompt_cache["model"]
+    if model is None:
+        model = genai.GenerativeModel(GEMINI_MODEL, system_instruction=prompt)
+        _prompt_cache["model"] = model
+    return model
+
+def _build_extract_prompt():
     """Erstellt den Extraktions-Prompt mit aktueller Fahrerliste."""
     # Fahrernamen aus driver_map fuer Prompt verwenden
     if driver_map:
@@ -544,13 +837,13 @@ def repair_gemini_json(text):
     text = text.replace("“", '"').replace("”", '"')
     text = text.replace("‘", "'").replace("’", "'")
     # 2. Fehlendes } vor , { (Gemini vergisst manchmal schliessende Klammer)
-    text = re.sub(r'("|\ d)(\s*\n\s*),(\s*\{)', r'\1\2},\3', text)
+    text = _REPAIR_MISSING_BRACE_RE.sub(r'\1\2},\3', text)
     # 3. Trailing commas vor } und ]
-    text = re.sub(r",\s*([}\\]])", r"\1", text)
+    text = _REPAIR_TRAILING_COMMA_RE.sub(r"\1", text)
     # 3. Einfache Anfuehrungszeichen bei Property-Namen -> doppelte
-    text = re.sub(r"'([^'\n]+)'(\s*:)", r'"\1"\2', text)
+    text = _REPAIR_SINGLE_QUOTE_KEY_RE.sub(r'"\1"\2', text)
     # 4. Unescapte Backslashes (ausser vor " n r t b f u)
-    text = re.sub(r'\\(?!["\\/bfnrtu])', r'\\\\', text)
+    text = _REPAIR_BACKSLASH_RE.sub(r'\\\\', text)
     # 5. Steuerzeichen in Strings entfernen (Tabs, Newlines innerhalb von Strings)
     # Ersetze echte Newlines innerhalb von JSON-String-Werten durch \n
     result = []
@@ -577,15 +870,130 @@ def repair_gemini_json(text):
     return "".join(result)
 
 
+class RateLimiter:
+    """Gleitendes Fenster: hoechstens `rpm` Aufrufe je 60s.
+    Thread-sicher; acquire() blockiert den aufrufenden (Worker-)Thread."""
+
+    def __init__(self, rpm, window=60.0):
+        self.rpm    = rpm
+        self.window = window
+        self._calls = deque()
+        self._lock  = threading.Lock()
+
+    def acquire(self):
+        """Wartet bis ein Slot frei ist. Gibt die Wartezeit in Sekunden zurueck."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.window:
+                    self._calls.popleft()
+                if len(self._calls) < self.rpm:
+                    self._calls.append(now)
+                    return waited
+                wait = self.window - (now - self._calls[0])
+            time.sleep(wait)
+            waited += wait
+
+
+class AimdLimiter:
+    """Adaptive Parallelitaet (AIMD) fuer Gemini-Auswertungen:
+    +0.5 bei Erfolg innerhalb der Ziel-Latenz, Halbierung bei 429/5xx."""
+
+    def __init__(self, start, maximum, target_latency):
+        self.limit   = float(start)
+        self.maximum = float(maximum)
+        self.target  = target_latency
+        self._active = 0
+        self._cond   = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < int(self.limit))
+            self._active += 1
+
+    async def __aexit__(self, *exc):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def on_success(self, latency):
+        if latency <= self.target and self.limit < self.maximum:
+            self.limit = min(self.maximum, self.limit + 0.5)
+
+    def on_overload(self):
+        self.limit = max(1.0, self.limit * 0.5)
+        log.warning(f"Gemini ueberlastet, Parallelitaet reduziert auf {int(self.limit)}.")
+
+
+gemini_rate_limiter = RateLimiter(GEMINI_RPM)
+gemini_limiter      = AimdLimiter(1, GEMINI_CONCURRENCY, GEMINI_TARGET_LATENCY)
+
+GEMINI_BACKOFF_BASE = 5.0    # Sekunden, Startwert fuer RPM-Backoff
+GEMINI_BACKOFF_MAX  = 300.0  # Sekunden, Obergrenze fuer RPM-Backoff
+GEMINI_SERVER_RETRIES = 3    # Wiederholungen bei 5xx (uebergelastet/nicht erreichbar)
+
+def generate_with_retry(contents, model=None):
+    """generate_content mit exponentiellem Backoff + Jitter bei 5xx (2s -> 4s -> 8s).
+    Laeuft im Worker-Thread, blockiert den Event-Loop also nicht."""
+    model = model or gemini_model
+    for attempt in range(GEMINI_SERVER_RETRIES + 1):
+        try:
+            return model.generate_content(contents, generation_config=GENERATION_CONFIG)
+        except ServerError as e:
+            if attempt == GEMINI_SERVER_RETRIES:
+                raise
+            wait = 2 ** (attempt + 1) + random.uniform(0, 1)
+            log.warning(f"Gemini Serverfehler ({e.code}), Versuch {attempt + 1}/"
+                        f"{GEMINI_SERVER_RETRIES}, warte {wait:.1f}s...")
+            time.sleep(wait)
+
+def gemini_retry_delay(exc):
+    """Liest die vom Server empfohlene Wartezeit (RetryInfo.retry_delay) in Sekunden, sonst None."""
+    for detail in getattr(exc, "details", None) or []:
+        delay = getattr(detail, "retry_delay", None)
+        if delay is not None:
+            return delay.seconds + delay.nanos / 1e9
+        if isinstance(detail, dict) and detail.get("retryDelay"):
+            try:
+                return float(str(detail["retryDelay"]).rstrip("s"))
+            except ValueError:
+                pass
+    m = _RETRY_DELAY_RE.search(str(exc))
+    return float(m.group(1)) if m else None
+
+_DAILY_QUOTA_MARKERS = ("per day", "perday", "per_day", "daily", "requestsperday")
+
+def gemini_is_daily_quota(exc):
+    """True wenn der 429 ein Tageslimit meldet. Enthalten die Details QuotaFailure-
+    Verletzungen mit quotaId, entscheidet allein diese (*PerDay / *_per_day);
+    nur ohne solche Details wird die Fehlermeldung durchsucht."""
+    quota_ids = []
+    for detail in getattr(exc, "details", None) or []:
+        violations = getattr(detail, "violations", None)
+        if violations is None and isinstance(detail, dict):
+            violations = detail.get("violations")
+        for v in violations or []:
+            quota_id = v.get("quotaId", "") if isinstance(v, dict) else getattr(v, "quota_id", "")
+            if quota_id:
+                quota_ids.append(str(quota_id).lower())
+    if quota_ids:
+        return any("perday" in q or "per_day" in q for q in quota_ids)
+    err_str = str(exc).lower()
+    return any(marker in err_str for marker in _DAILY_QUOTA_MARKERS)
+
 _gemini_rpm_strikes   = 0    # Zaehlt aufeinanderfolgende RPM-Fehler
 _gemini_daily_count   = 0    # Zaehlt API-Calls heute
 _gemini_minute_count  = 0    # Zaehlt API-Calls in der aktuellen Minute
 _gemini_minute_start  = None # Startzeitpunkt des aktuellen Minuten-Fensters
 _gemini_last_call     = None # Zeitpunkt des letzten API-Calls (fuer 24h-Reset)
 
-def call_gemini(img, prompt, reason="Screenshot"):
+def call_gemini(img, prompt, reason="Screenshot", model=None):
     global gemini_blocked_until, _gemini_rpm_strikes
     global _gemini_daily_count, _gemini_minute_count, _gemini_minute_start, _gemini_last_call
+    waited = gemini_rate_limiter.acquire()
+    if waited:
+        log.info(f"Gemini RPM-Limit lokal erreicht, {waited:.1f}s gewartet.")
     from datetime import datetime as _dt
     now = _dt.now()
 
@@ -610,30 +1018,27 @@ def call_gemini(img, prompt, reason="Screenshot"):
              f"Minute={_gemini_minute_count} (seit {_gemini_minute_start.strftime('%H:%M:%S')})")
 
     try:
-        response = gemini_model.generate_content(
-            [prompt, img],
-            generation_config=GENERATION_CONFIG
-        )
+        response = generate_with_retry([prompt, img], model)
         _gemini_rpm_strikes = 0  # Erfolg: Strikes zuruecksetzen
         text = response.text.strip()
-        text = re.sub(r"^```json\s*", "", text)
-        text = re.sub(r"\s*```$",     "", text)
+        # JSON-Modus liefert reines JSON; Zaeune/Freitext nur als Absicherung entfernen
+        text = text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+        start, end = text.find("{"), text.rfind("}")
+        if start != -1 and end > start:
+            text = text[start:end + 1]
         try:
-            return json.loads(text)
+            return json_loads(text)
         except json.JSONDecodeError as je:
             log.warning(f"JSON-Parsing fehlgeschlagen ({je})")
             log.warning(f"Rohe Gemini-Antwort: {text[:800]}")
             fixed = repair_gemini_json(text)
             try:
-                return json.loads(fixed)
+                return json_loads(fixed)
             except json.JSONDecodeError as je2:
                 log.error(f"JSON-Reparatur fehlgeschlagen ({je2}): {fixed[:500]}")
                 raise
     except ResourceExhausted as e:
-        err_str = str(e).lower()
-        if ("per day" in err_str or "daily" in err_str or "quota_exceeded" in err_str
-                or "requestsperday" in err_str or "perday" in err_str
-                or "free_tier_requests" in err_str):
+        if gemini_is_daily_quota(e):
             # Tageslimit: bis 09:00 Uhr lokaler Zeit (Google Reset = 0 Uhr Pacific = 9 Uhr DE)
             now  = datetime.now()
             reset = now.replace(hour=9, minute=0, second=0, microsecond=0)
@@ -643,26 +1048,36 @@ def call_gemini(img, prompt, reason="Screenshot"):
             log.error(f"Gemini Tageslimit erreicht. Sperre bis {reset.strftime('%H:%M')} Uhr.")
             raise GeminiQuotaError("daily") from e
         else:
-            # Minutenlimit: Backoff exponentiell erhoehen (5 -> 10 -> 20 -> max 60 Min)
+            # Minutenlimit: vom Server empfohlene Wartezeit (retry_delay) plus 2s Puffer
+            # und bis zu 20% Jitter, sonst exponentieller Backoff mit Jitter
+            # (5s -> 10s -> 20s ... max 300s)
             _gemini_rpm_strikes += 1
-            backoff = min(5 * (2 ** (_gemini_rpm_strikes - 1)), 60)
-            gemini_blocked_until = datetime.now() + timedelta(minutes=backoff)
+            backoff = gemini_retry_delay(e)
+            if backoff is not None:
+                backoff += 2 + random.uniform(0, 0.2) * backoff
+            else:
+                backoff = (min(GEMINI_BACKOFF_MAX,
+                               GEMINI_BACKOFF_BASE * 2 ** (_gemini_rpm_strikes - 1))
+                           + random.uniform(0, GEMINI_BACKOFF_BASE))
+            gemini_blocked_until = datetime.now() + timedelta(seconds=backoff)
             log.warning(f"Gemini Minutenlimit erreicht (Strike {_gemini_rpm_strikes}). "
-                        f"Sperre fuer {backoff} Minuten.")
+                        f"Sperre fuer {backoff:.0f} Sekunden.")
             raise GeminiQuotaError("rpm") from e
     except Exception as e:
         log.error(f"Gemini Fehler ({type(e).__name__}): {str(e)}")
         raise
 
 def gemini_is_blocked():
+    """Verbleibende Sperrzeit in Sekunden, None wenn Gemini verfuegbar ist."""
     global gemini_blocked_until
     if gemini_blocked_until is None:
-        return False
-    if datetime.now() >= gemini_blocked_until:
+        return None
+    remaining = (gemini_blocked_until - datetime.now()).total_seconds()
+    if remaining <= 0:
         gemini_blocked_until = None
         log.info("Gemini-Sperre aufgehoben.")
-        return False
-    return True
+        return None
+    return remaining
 
 def berlin_time_str(dt):
     """Gibt Uhrzeit in Berliner Zeit als HH:MM zurueck."""
@@ -675,9 +1090,66 @@ def berlin_time_str(dt):
         dt_berlin = dt + timedelta(hours=2)
     return dt_berlin.strftime("%H:%M")
 
+# Zuletzt geladene Attachments {attachment_id: bytes} - Retries nach Quota-Fehler,
+# !sort und Reply-Overrides laden dasselbe Bild sonst erneut vom CDN
+_attachment_cache: OrderedDict = OrderedDict()
+
 async def download_attachment(attachment):
-    """Laedt Attachment ueber den authentifizierten Discord-HTTP-Client herunter."""
-    return await discord_client.http.get_from_cdn(attachment.url)
+    """Laedt Attachment ueber den authentifizierten Discord-HTTP-Client herunter (gecacht)."""
+    data = _attachment_cache.get(attachment.id)
+    if data is None:
+        data = await discord_client.http.get_from_cdn(attachment.url)
+        _attachment_cache[attachment.id] = data
+        while len(_attachment_cache) > ATTACHMENT_CACHE_SIZE:
+            _attachment_cache.popitem(last=False)
+    _attachment_cache.move_to_end(attachment.id)
+    return data
+
+# Parallele Loeschungen begrenzen - das Rate-Limit-Bucket verwaltet discord.py selbst
+_delete_semaphore = asyncio.Semaphore(5)
+
+async def delete_quietly(msg, what="Nachricht"):
+    """Loescht eine Nachricht, Fehler werden nur geloggt. Gibt True bei Erfolg zurueck."""
+    async with _delete_semaphore:
+        try:
+            await msg.delete()
+            return True
+        except Exception as e:
+            log.warning(f"Konnte {what} nicht loeschen: {e}")
+            return False
+
+async def delete_all(msgs, what="Nachricht"):
+    """Loescht Nachrichten parallel. Gibt die Anzahl geloeschter Nachrichten zurueck."""
+    results = await asyncio.gather(*(delete_quietly(m, what) for m in msgs))
+    return sum(results)
+
+async def bulk_delete(channel, msgs, what="Nachricht"):
+    """Loescht Nachrichten per Bulk-Delete (max 100 pro Request, nur < 14 Tage alt).
+    Aeltere Nachrichten und fehlgeschlagene Bloecke werden einzeln geloescht."""
+    cutoff = discord.utils.utcnow() - timedelta(days=14) + timedelta(minutes=5)
+    young  = [m for m in msgs if m.created_at > cutoff]
+    old    = [m for m in msgs if m.created_at <= cutoff]
+    deleted = 0
+    for i in range(0, len(young), 100):
+        chunk = young[i:i + 100]
+        try:
+            await channel.delete_messages(chunk)
+            deleted += len(chunk)
+        except discord.HTTPException as e:
+            log.warning(f"Bulk-Delete fehlgeschlagen ({e}), loesche einzeln.")
+            old.extend(chunk)
+    return deleted + await delete_all(old, what)
+
+def chunk_lines(lines, limit=2000):
+    """Fasst Zeilen zu moeglichst wenigen Nachrichten bis `limit` Zeichen zusammen."""
+    chunk = ""
+    for line in lines:
+        if chunk and len(chunk) + 1 + len(line) > limit:
+            yield chunk
+            chunk = ""
+        chunk = f"{chunk}\n{line}" if chunk else line[:limit]
+    if chunk:
+        yield chunk
 
 async def clear_quota_msg(channel):
     """Loescht die Quota-Warnmeldung wenn Sperre aufgehoben."""
@@ -717,8 +1189,9 @@ async def check_gemini_version(channel):
             _gemini_minute_count += 1
         log.info(f"Gemini API-Call: Grund=Versionscheck | Heute={_gemini_daily_count} | "
                  f"Minute={_gemini_minute_count}")
+        await _asyncio.to_thread(gemini_rate_limiter.acquire)
         response = await _asyncio.to_thread(
-            gemini_model.generate_content, prompt, generation_config=GENERATION_CONFIG
+            gemini_model.generate_content, prompt, generation_config=TEXT_GENERATION_CONFIG
         )
         text = response.text.strip()
         log.info(f"Gemini-Versions-Check: {text}")
@@ -738,20 +1211,44 @@ async def check_gemini_version(channel):
     except Exception as e:
         log.warning(f"Gemini-Versions-Check fehlgeschlagen: {e}")
 
-def _analyse_image_sync(image_path):
-    """Synchroner Kern der Bildanalyse - wird in Thread ausgelagert."""
-    img    = Image.open(image_path)
+def downscale_for_gemini(image_bytes):
+    """Skaliert den Screenshot auf GEMINI_IMAGE_MAX_EDGE und kodiert ihn als JPEG.
+    Weniger Upload-Bytes und Input-Tokens pro Gemini-Call. Gibt ein Blob-Dict zurueck,
+    das fuer beide Durchlaeufe wiederverwendet wird."""
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        orig_size = img.size
+        img.thumbnail((GEMINI_IMAGE_MAX_EDGE, GEMINI_IMAGE_MAX_EDGE), Image.LANCZOS)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        out = io.BytesIO()
+        img.save(out, "JPEG", quality=GEMINI_JPEG_QUALITY)
+    data = out.getvalue()
+    log.info(f"Bild skaliert {orig_size[0]}x{orig_size[1]} -> {img.width}x{img.height} "
+             f"({len(image_bytes) // 1024} -> {len(data) // 1024} KB)")
+    return {"mime_type": "image/jpeg", "data": data}
+
+# Gemini-Auswertungen {sha256(bild): data} - erneut hochgeladene Screenshots
+# kosten keinen API-Call. Zugriff nur aus dem Event-Loop.
+_analysis_cache: OrderedDict = OrderedDict()
+
+def cached_analysis(image_hash):
+    data = _analysis_cache.get(image_hash)
+    if data is None:
+        return None
+    _analysis_cache.move_to_end(image_hash)
+    return copy.deepcopy(data)  # Aufrufer ueberschreibt z.B. grid bei Override
 
-    # Bild auf max 1600px Breite skalieren fuer kuerzere Verarbeitungszeit
-    max_width = 1600
-    if img.width > max_width:
-        ratio = max_width / img.width
-        new_h = int(img.height * ratio)
-        img = img.resize((max_width, new_h), Image.LANCZOS)
-        log.info(f"Bild skaliert auf {max_width}x{new_h}")
+def store_analysis(image_hash, data):
+    _analysis_cache[image_hash] = copy.deepcopy(data)
+    while len(_analysis_cache) > GEMINI_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
 
-    prompt = build_extract_prompt()
-    data   = call_gemini(img, prompt, reason="Screenshot Durchlauf 1")
+def _analyse_image_sync(image_bytes):
+    """Synchroner Kern der Bildanalyse - wird in Thread ausgelagert. Liest direkt aus den Bytes."""
+    img    = downscale_for_gemini(image_bytes)
+
+    data   = call_gemini(img, EXTRACT_USER_TURN, reason="Screenshot Durchlauf 1",
+                         model=extract_model())
     log.info(f"Durchlauf 1: Rennen {data.get('rennen')}, Grid {data.get('grid')}, "
              f"{len(data.get('fahrer', []))} Fahrer")
 
@@ -768,7 +1265,12 @@ def _analyse_image_sync(image_path):
 
     run_second = GEMINI_2ND_RUN == 2
     if GEMINI_2ND_RUN == 1:
-        run_second = len(validate_deltas(data.get("fahrer", []))) > 0
+        delta_errors = validate_deltas(data.get("fahrer", []))
+        run_second   = len(delta_errors) > 0
+        if not run_second:
+            # Ergebnis gilt fuer die zurueckgegebenen Daten - write_results prueft nicht erneut.
+            # Nur ohne Durchlauf 2 setzen, sonst landet der Schluessel im Verifikations-Prompt.
+            data["_delta_errors"] = delta_errors
 
     if run_second:
         log.info("Starte Durchlauf 2 (Verifikation)...")
@@ -786,6 +1288,7 @@ def _analyse_image_sync(image_path):
     return data
 
 # ── Ergebnisse ins Sheet schreiben ────────────────────────────────────────────
+@gspread_retry
 def write_results(sheet, data, rennen_override=None):
     """
     Schreibt Ergebnisse ins Sheet via Batch-Update.
@@ -798,29 +1301,50 @@ def write_results(sheet, data, rennen_override=None):
     fahrer_list = data["fahrer"]
     warnings    = []
 
+    # Beide Listen kommen aus dem TTL-Cache, nach LIST_CACHE_TTL wird nachgeladen
+    load_car_list()
     driver_map, gt7_name_map, discord_id_map = load_driver_list()
 
-    block = resolve_block(sheet, rennen, grid_label)
+    # Grid-Label von Block 2 und bisherige FL-Zeit in einem Aufruf lesen
+    label_a1 = rowcol_to_a1(*get_grid_label_cell(rennen, 2))
+    fl_a1    = rowcol_to_a1(FASTEST_LAP_ROW, get_cell_col(rennen, REL_FL_TIME))
+    label_vals, fl_vals = sheet.batch_get([label_a1, fl_a1])
+
+    block = resolve_block(sheet, rennen, grid_label, range_val(label_vals, 0, 0).lower())
     log.info(f"Rennen {rennen}, Grid '{grid_label}' -> Block {block}")
 
-    delta_errors       = validate_deltas(fahrer_list)
+    delta_errors       = data.get("_delta_errors")
+    if delta_errors is None:
+        delta_errors = validate_deltas(fahrer_list)
     fastest_time_int   = None
     fastest_lap_driver = None
     batch              = {}
     red_cells          = []
     first_pos          = None
 
+    # Zeilen-/Spaltenbasis einmal berechnen statt get_cell() pro Zelle
+    rs    = row_start(block)
+    cs    = col_start(rennen)
+    c_drv = cs + REL_DRIVER
+    c_tm  = cs + REL_TEAM
+    c_car = cs + REL_CAR
+    c_rt  = cs + REL_RACETIME
+    c_lp  = cs + REL_LAPS
+    cols  = (c_drv, c_tm, c_car, c_rt, c_lp)
+
     # Grid-Label
-    r, c = get_grid_label_cell(rennen, block)
-    batch[rowcol_to_a1(r, c)] = grid_label
+    batch[(rs, cs + REL_GRID_LABEL)] = grid_label
 
-    for fahrer in sorted(fahrer_list, key=lambda x: x["position"]):
+    for fahrer in by_position(fahrer_list):
         pos            = int(fahrer["position"])
+        r              = rs + pos - 1
         name_raw       = fahrer["name"]
         auto_raw       = fahrer["auto"]
         # Uebersetzung: Spielname -> Tabellenname via Car_Translate
-        auto           = car_translate_map.get(auto_raw.lower(), auto_raw)
-        auto_unbekannt = auto == auto_raw and auto_raw.lower() not in car_translate_map
+        auto           = car_translate_map.get(auto_raw.casefold())
+        auto_unbekannt = auto is None
+        if auto_unbekannt:
+            auto = auto_raw
         zeit           = fahrer.get("zeit", "")
         beste_runde    = fahrer.get("beste_runde", "")
 
@@ -829,16 +1353,14 @@ def write_results(sheet, data, rennen_override=None):
 
         # Fahrername und Team aus Fahrerliste (case-insensitive)
         # Erst Tabellenname (Spalte C), dann GT7-Name (Spalte DB)
-        name_key = name_raw.lower()
-        if name_key in driver_map:
-            name, team, _ = driver_map[name_key]
-        elif name_key in gt7_name_map:
-            name, team, _ = gt7_name_map[name_key]
+        name_key = name_raw.casefold()
+        entry    = driver_map.get(name_key) or gt7_name_map.get(name_key)
+        if entry:
+            name, team, _ = entry
         else:
             name = name_raw
             team = ""
-            r_drv, c_drv = get_cell(rennen, block, pos, "driver")
-            red_cells.append((r_drv, c_drv))
+            red_cells.append((r, c_drv))
             warnings.append(
                 (2, f"👤 Rennen {rennen}, Grid {grid_label}, Pos {pos}, {name_raw}: "
                 f"Fahrer nicht in Fahrerliste")
@@ -851,29 +1373,23 @@ def write_results(sheet, data, rennen_override=None):
         log.info(f"  P{pos} {name_log} | {auto_log} | racetime={racetime} "
                  f"laps={laps} fl={beste_runde}")
 
-        r_drv, c_drv = get_cell(rennen, block, pos, "driver")
-        r_tm,  c_tm  = get_cell(rennen, block, pos, "team")
-        r_car, c_car = get_cell(rennen, block, pos, "car")
-        r_rt,  c_rt  = get_cell(rennen, block, pos, "racetime")
-        r_lp,  c_lp  = get_cell(rennen, block, pos, "laps")
-
-        batch[rowcol_to_a1(r_drv, c_drv)] = name
-        batch[rowcol_to_a1(r_tm,  c_tm)]  = team
-        batch[rowcol_to_a1(r_car, c_car)] = auto
+        batch[(r, c_drv)] = name
+        batch[(r, c_tm)]  = team
+        batch[(r, c_car)] = auto
         if racetime is not None:
-            batch[rowcol_to_a1(r_rt, c_rt)] = racetime
+            batch[(r, c_rt)] = racetime
         if laps is not None:
-            batch[rowcol_to_a1(r_lp, c_lp)] = laps
+            batch[(r, c_lp)] = laps
 
         if auto_unbekannt:
-            red_cells.append((r_car, c_car))
+            red_cells.append((r, c_car))
             warnings.append(
                 (3, f"🚗 Rennen {rennen}, Grid {grid_label}, Pos {pos}, {name}: "
                 f"Auto '{auto}' nicht erkannt - bitte manuell pruefen")
             )
 
         if pos in delta_errors:
-            red_cells.append((r_rt, c_rt))
+            red_cells.append((r, c_rt))
             warnings.append(
                 (4, f"⏱️ Grid {grid_label}, Pos {pos}, {name}: Zeit ist zu pruefen")
             )
@@ -884,49 +1400,63 @@ def write_results(sheet, data, rennen_override=None):
             )
 
         if beste_runde:
-            br_digits = re.sub(r"[^\d]", "", beste_runde)
+            br_digits = only_digits(beste_runde)
             if br_digits:
                 br_int = int(br_digits)
                 if fastest_time_int is None or br_int < fastest_time_int:
                     fastest_time_int   = br_int
                     fastest_lap_driver = name
 
-    sheet.batch_update([
-        {"range": addr, "values": [[val]]}
-        for addr, val in batch.items()
-    ])
-    log.info(f"Batch-Update: {len(batch)} Zellen geschrieben")
-
-    # Alle beschriebenen Zellen grau, Fehler-Zellen rot – ein einziger API-Aufruf
-    all_cells = set()
-    for fahrer in fahrer_list:
-        pos = int(fahrer["position"])
-        for field in ("driver", "team", "car", "racetime", "laps"):
-            all_cells.add(get_cell(rennen, block, pos, field))
-    gl_r, gl_c = get_grid_label_cell(rennen, block)
-    all_cells.add((gl_r, gl_c))
+    # Alle beschriebenen Zellen grau, Fehler-Zellen rot
+    all_cells = {(rs + int(f["position"]) - 1, c) for f in fahrer_list for c in cols}
+    all_cells.add((rs, cs + REL_GRID_LABEL))
 
-    red_set  = set(red_cells)
-    grey_set = all_cells - red_set
-    batch_format_cells(sheet, grey_set, red_set)
+    colors = {cell: GREY2 for cell in all_cells}
+    colors.update({cell: RED for cell in red_cells})
 
     if fastest_lap_driver and fastest_time_int is not None:
-        update_fastest_lap(sheet, rennen, fastest_lap_driver, fastest_time_int)
+        batch.update(fastest_lap_cells(rennen, fastest_lap_driver, fastest_time_int,
+                                       range_val(fl_vals, 0, 0)))
+
+    # Werte, Farben und schnellste Runde in einem einzigen spreadsheets.batchUpdate
+    requests = cell_requests(sheet.id, batch, colors)
+    sheet.spreadsheet.batch_update({"requests": requests})
+    log.info(f"Batch-Update: {len(batch)} Zellen geschrieben, {len(colors)} formatiert "
+             f"({len(requests)} Bereiche)")
 
     return warnings, rennen, grid_label, first_pos
 
 # ── Race-Kasten (Embed) ───────────────────────────────────────────────────────
 NA_PHRASES = {"strecke in db_tech definieren!", "n/a", ""}
 
+@gspread_retry
 def build_race_embed(rennen):
     """Liest Daten aus Sheet und baut Discord-Embed fuer Rennkasten."""
     try:
         sheet = get_sheet()
         cs    = col_start(rennen)
 
-        date_raw  = (sheet.cell(3, cs + 2).value or "").strip()  # D3
-        track_raw = (sheet.cell(3, cs + 3).value or "").strip()  # E3
-        drv_raw   = (sheet.cell(4, cs).value     or "").strip()  # B4
+        # Alle benoetigten Bereiche in einem einzigen API-Aufruf lesen:
+        #   [0] D3:G3 (Datum, Track, FL-Fahrer, FL-Zeit), [1] B4 (Drivers),
+        #   [2..5] je Grid-Block Grid-Label bis TotalTime (20 Zeilen)
+        ranges = [
+            rowcol_to_a1(FASTEST_LAP_ROW, cs + 2) + ":" +
+            rowcol_to_a1(FASTEST_LAP_ROW, cs + REL_FL_TIME),
+            rowcol_to_a1(4, cs),
+        ]
+        for block in range(4):
+            r_start = row_start(block)
+            ranges.append(
+                rowcol_to_a1(r_start, cs + REL_GRID_LABEL) + ":" +
+                rowcol_to_a1(r_start + 19, cs + REL_TOTALTIME)
+            )
+        head, drv_cell, *blocks = sheet.batch_get(ranges)
+
+        date_raw  = range_val(head, 0, 0)                              # D3
+        track_raw = range_val(head, 0, 1)                              # E3
+        fl_drv    = range_val(head, 0, REL_FL_DRIVER - 2)
+        fl_tim    = range_val(head, 0, REL_FL_TIME - 2)
+        drv_raw   = range_val(drv_cell, 0, 0)                          # B4
 
         date_str  = "n/a" if date_raw.lower()  in NA_PHRASES else date_raw
         track_str = "n/a" if track_raw.lower() in NA_PHRASES else track_raw
@@ -943,21 +1473,15 @@ def build_race_embed(rennen):
             lines.append(f"Drivers: {drv_raw}")
 
         # Sieger je Grid-Block (anhand TotalTime, Strafen beruecksichtigt)
-        cs = col_start(rennen)
         winners     = []
         annotations = []  # Fussnoten fuer Abweichungen
-        for block in range(4):
-            gl_r, gl_c = get_grid_label_cell(rennen, block)
-            gl_val     = (sheet.cell(gl_r, gl_c).value or "").strip()
+        for block_rows in blocks:
+            gl_val = range_val(block_rows, 0, REL_GRID_LABEL)
             if not gl_val:
                 continue
 
-            # Alle Fahrer des Blocks lesen (max 20 Zeilen)
-            r_start = row_start(block)
-            block_data = sheet.get(
-                rowcol_to_a1(r_start, cs + REL["driver"]) + ":" +
-                rowcol_to_a1(r_start + 19, cs + REL["totaltime"])
-            )
+            # Fahrerdaten ab Spalte Driver (max 20 Zeilen)
+            block_data = [row[REL_DRIVER:] for row in block_rows]
 
             best_time  = None
             best_name  = None
@@ -966,9 +1490,9 @@ def build_race_embed(rennen):
 
             for i, row in enumerate(block_data):
                 rel_drv  = 0
-                rel_laps = REL["laps"]       - REL["driver"]
-                rel_pen  = REL["penalty"]    - REL["driver"]
-                rel_tot  = REL["totaltime"]  - REL["driver"]
+                rel_laps = REL_LAPS       - REL_DRIVER
+                rel_pen  = REL_PENALTY    - REL_DRIVER
+                rel_tot  = REL_TOTALTIME  - REL_DRIVER
 
                 name = row[rel_drv].strip() if len(row) > rel_drv else ""
                 if not name:
@@ -994,7 +1518,7 @@ def build_race_embed(rennen):
                         t_sek = float(tot_raw) * 86400
                     else:
                         tot_clean = str(tot_raw).replace(",", ".").replace(";", ".")
-                        parts = re.split(r"[:.]", tot_clean)
+                        parts = _TIME_SPLIT_RE.split(tot_clean)
                         if len(parts) == 4:
                             t_sek = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + int(parts[3])/1000
                         elif len(parts) == 3:
@@ -1038,8 +1562,6 @@ def build_race_embed(rennen):
                 lines.extend(annotations)
 
         # Schnellste Runde: erst Zeit, dann Name
-        fl_drv = (sheet.cell(FASTEST_LAP_ROW, cs + REL["fl_driver"]).value or "").strip()
-        fl_tim = (sheet.cell(FASTEST_LAP_ROW, cs + REL["fl_time"]).value   or "").strip()
         if fl_drv:
             lines.append(f"FL: {fl_tim} - {fl_drv}")
 
@@ -1050,6 +1572,10 @@ def build_race_embed(rennen):
         return embed
 
     except Exception as e:
+        if is_gspread_auth_error(e):
+            if not gspread_retrying():
+                raise  # gspread_retry autorisiert neu und wiederholt einmal
+            reset_gspread_cache()
         log.error(f"Fehler beim Erstellen des Race-Embeds fuer Rennen {rennen}: {e}")
         embed = discord.Embed(
             description=f"**Race {rennen:02d}**",
@@ -1059,14 +1585,12 @@ def build_race_embed(rennen):
 
 def parse_race_number_from_embed(message):
     """Liest Rennnummer aus Bot-Embed-Description (**Race XX**). Gibt None zurueck wenn kein Race-Embed."""
-    if not hasattr(discord_client, 'user') or discord_client.user is None:
-        return None
-    if message.author.id != discord_client.user.id:
+    if BOT_USER_ID is None or not message.embeds or message.author.id != BOT_USER_ID:
         return None
     for embed in message.embeds:
         if embed.description:
             # Race-Kasten: beginnt mit **Race XX**, kein · im Text (Screenshot-Posts haben ·)
-            m = re.match(r"^\*\*Race (\d+)", embed.description.strip())
+            m = _RACE_EMBED_RE.match(embed.description.strip())
             if m and "·" not in embed.description:
                 return int(m.group(1))
     return None
@@ -1074,16 +1598,12 @@ def parse_race_number_from_embed(message):
 def parse_screenshot_meta_from_msg(message):
     """Liest Grid und Seite aus Reaktions-Emojis eines Bot-Bild-Posts.
     Gibt {"grid": str, "page": int} oder None zurueck."""
-    if not hasattr(discord_client, 'user') or discord_client.user is None:
-        return None
-    if message.author.id != discord_client.user.id:
+    if BOT_USER_ID is None or message.author.id != BOT_USER_ID:
         return None
     # Nur Posts mit Bild-Anhang
-    has_image = any(a.content_type and a.content_type.startswith("image/")
-                    for a in message.attachments)
-    if not has_image:
+    if not has_image(message):
         return None
-    return parse_meta_from_reactions(message.reactions, discord_client.user.id)
+    return parse_meta_from_reactions(message.reactions, BOT_USER_ID)
 
 GRID_ORDER = {"1": 0, "2": 1, "2a": 1, "2b": 2, "3": 3}
 
@@ -1094,19 +1614,87 @@ def screenshot_sort_key(meta):
     return (grid_idx, meta["page"])
 
 # ── Discord Hilfsfunktionen ───────────────────────────────────────────────────
+# Race-Kaesten werden lokal indiziert, damit nicht bei jeder Suche bis zu
+# 200 Nachrichten Channel-History geladen werden muessen.
+_race_box_index: dict = {}  # {rennen: message_id}
+# Bot-Bild-Posts seit dem letzten Race-Kasten (fuer Duplikat-Check ohne History)
+_screenshot_index: dict = {}  # {(grid, seite): message_id}
+
+def index_race_box(message):
+    """Nimmt eine Nachricht in den Race-Kasten-Index auf, falls sie einer ist."""
+    rn = parse_race_number_from_embed(message)
+    if rn is not None:
+        _race_box_index[rn] = message.id
+        # Neuer Kasten: bisherige Bild-Posts gehoeren zum vorigen Rennen
+        if message.id > max(_screenshot_index.values(), default=0):
+            _screenshot_index.clear()
+    return rn
+
+def index_screenshot(message_id, grid, page):
+    _screenshot_index[(grid, page)] = message_id
+
+def unindex_message(message_id):
+    for rn, mid in list(_race_box_index.items()):
+        if mid == message_id:
+            del _race_box_index[rn]
+    for key, mid in list(_screenshot_index.items()):
+        if mid == message_id:
+            del _screenshot_index[key]
+
+async def hydrate_race_box_index(channel, limit=200):
+    """Einmaliger History-Scan beim Start (neueste Nachricht gewinnt)."""
+    _race_box_index.clear()
+    _screenshot_index.clear()
+    # oldest_first ohne after liefert die aeltesten Nachrichten des Channels -
+    # daher die neuesten `limit` laden und chronologisch durchgehen
+    messages = [msg async for msg in channel.history(limit=limit)]
+    for msg in reversed(messages):
+        if index_race_box(msg) is not None:
+            continue
+        meta = parse_screenshot_meta_from_msg(msg)
+        if meta:
+            index_screenshot(msg.id, meta["grid"], meta["page"])
+        elif any(r.me and str(r.emoji) in TERMINAL_EMOJIS for r in msg.reactions):
+            finished_ids.add(msg.id)
+    log.info(f"Race-Kasten-Index: {len(_race_box_index)} Kaesten, "
+             f"{len(_screenshot_index)} Bild-Posts seit dem letzten Kasten.")
+
+async def fetch_indexed(channel, message_id):
+    try:
+        return await channel.fetch_message(message_id)
+    except discord.NotFound:
+        unindex_message(message_id)
+        return None
+
 async def find_last_race_box(channel):
     """Findet die letzte Race-Kasten-Nachricht. Gibt (message, rennen) zurueck."""
+    while _race_box_index:
+        rn  = max(_race_box_index, key=_race_box_index.get)
+        msg = await fetch_indexed(channel, _race_box_index[rn])
+        if msg is not None:
+            return msg, rn
+    # Fallback: Index leer -> History durchsuchen
     async for msg in channel.history(limit=200):
-        rn = parse_race_number_from_embed(msg)
+        rn = index_race_box(msg)
         if rn is not None:
             return msg, rn
     return None, None
 
+async def last_race_box(channel, box=None):
+    """Gibt box zurueck falls der Aufrufer den Race-Kasten schon kennt, sonst Suche."""
+    return box if box is not None else await find_last_race_box(channel)
+
 async def find_race_box(channel, rennen):
     """Findet Race-Kasten fuer ein bestimmtes Rennen."""
+    mid = _race_box_index.get(rennen)
+    if mid is not None:
+        msg = await fetch_indexed(channel, mid)
+        if msg is not None:
+            return msg
     async for msg in channel.history(limit=200):
         rn = parse_race_number_from_embed(msg)
         if rn == rennen:
+            index_race_box(msg)
             return msg
     return None
 
@@ -1118,7 +1706,7 @@ async def update_race_box(channel, rennen):
         await existing.edit(embed=embed)
         log.info(f"Race-Kasten Rennen {rennen} aktualisiert.")
     else:
-        await channel.send(embed=embed)
+        index_race_box(await channel.send(embed=embed))
         log.info(f"Race-Kasten Rennen {rennen} erstellt.")
 
 # ── !sort ─────────────────────────────────────────────────────────────────────
@@ -1150,14 +1738,9 @@ def build_legend_embed(downloaded):
 
 def is_legend_embed(message):
     """Prueft ob eine Nachricht die Legende ist."""
-    if not hasattr(discord_client, "user") or discord_client.user is None:
-        return False
-    if message.author.id != discord_client.user.id:
+    if BOT_USER_ID is None or not message.embeds or message.author.id != BOT_USER_ID:
         return False
-    for embed in message.embeds:
-        if embed.footer and embed.footer.text == "​":
-            return True
-    return False
+    return any(embed.footer and embed.footer.text == "​" for embed in message.embeds)
 
 
 async def cmd_check(channel):
@@ -1168,44 +1751,45 @@ async def cmd_check(channel):
     """
     status = await channel.send("Prüfe Eintraege...")
     try:
-        _, rennen = await find_last_race_box(channel)
+        last_box_msg, rennen = await find_last_race_box(channel)
         if rennen is None:
             await status.edit(content="Kein Race-Kasten gefunden.")
             return
 
-        sheet    = get_sheet()
+        sheet    = await run_sync(get_sheet)
         cs       = col_start(rennen)
         row_from = FIRST_DATA_ROW
         row_to   = FIRST_DATA_ROW + 4 * ROW_OFFSET_PER_GRID - 1
-        c_drv    = cs + REL["driver"]
-        c_car    = cs + REL["car"]
+        c_drv    = cs + REL_DRIVER
+        c_car    = cs + REL_CAR
 
-        # Fahrer und Autos in einem Aufruf lesen
+        # Fahrer und Autos in einem Aufruf lesen, Listen gleichzeitig immer frisch
+        # laden damit neue Eintraege sofort wirken
         data_range = f"{rowcol_to_a1(row_from, c_drv)}:{rowcol_to_a1(row_to, c_car)}"
-        rows = sheet.get(data_range)
-
-        # Immer frisch laden damit neue Eintraege sofort wirken
-        load_car_list()
-        driver_map, gt7_name_map, discord_id_map = load_driver_list()
+        rows, (driver_map, gt7_name_map, discord_id_map) = await asyncio.gather(
+            run_sync(sheet.get, data_range), reload_lists(force=True))
+        valid_tabellen = {c.casefold() for c in car_list}
+        car_idx        = REL_CAR - REL_DRIVER
 
         batch_vals  = {}
-        grey_cells  = []
+        grey_cells  = set()
         report      = []  # [(typ, original, korrigiert_zu, ok)]
 
         for i, row in enumerate(rows):
             abs_row  = row_from + i
             drv_val  = row[0].strip() if len(row) > 0 else ""
-            car_val  = row[REL["car"] - REL["driver"]].strip() if len(row) > (REL["car"] - REL["driver"]) else ""
+            car_val  = row[car_idx].strip() if len(row) > car_idx else ""
 
             # Fahrer pruefen
             if drv_val:
-                if drv_val.lower() in driver_map:
+                drv_key = drv_val.casefold()
+                if drv_key in driver_map:
                     pass  # bereits korrekter Tabellenname -> ok
-                elif drv_val.lower() in gt7_name_map:
+                elif drv_key in gt7_name_map:
                     # GT7-Name gefunden -> in Tabellennamen uebersetzen
-                    korrigiert, _ = gt7_name_map[drv_val.lower()]
-                    batch_vals[rowcol_to_a1(abs_row, c_drv)] = korrigiert
-                    grey_cells.append((abs_row, c_drv))
+                    korrigiert, _, _ = gt7_name_map[drv_key]
+                    batch_vals[(abs_row, c_drv)] = korrigiert
+                    grey_cells.add((abs_row, c_drv))
                     report.append(("Fahrer", drv_val, korrigiert, True))
                 else:
                     # Weder Tabellenname noch bekannter GT7-Name
@@ -1213,67 +1797,69 @@ async def cmd_check(channel):
 
             # Auto pruefen
             if car_val:
-                valid_tabellen = {c.lower() for c in car_list}
-                if car_val.lower() in valid_tabellen:
+                car_key = car_val.casefold()
+                if car_key in valid_tabellen:
                     pass  # bereits korrekter Tabellenname -> ok
-                elif car_val.lower() in car_translate_map:
+                elif car_key in car_translate_map:
                     # Spielname gefunden -> in Tabellenname uebersetzen
-                    korrigiert = car_translate_map[car_val.lower()]
-                    batch_vals[rowcol_to_a1(abs_row, c_car)] = korrigiert
-                    grey_cells.append((abs_row, c_car))
+                    korrigiert = car_translate_map[car_key]
+                    batch_vals[(abs_row, c_car)] = korrigiert
+                    grey_cells.add((abs_row, c_car))
                     report.append(("Auto", car_val, korrigiert, True))
                 else:
                     # Weder Tabellenname noch bekannter Spielname
                     report.append(("Auto", car_val, None, False))
 
-        # Korrekturen schreiben
-        if batch_vals:
-            sheet.batch_update([
-                {"range": addr, "values": [[val]]}
-                for addr, val in batch_vals.items()
-            ])
-
         # Alle Zellen grau faerben die jetzt korrekt sind
         # (korrigierte + bereits korrekte - beide sollen hellgrau werden)
-        valid_tabellen = {c.lower() for c in car_list}
-        all_grey = list(grey_cells)  # bereits korrigierte
+        all_grey = set(grey_cells)  # bereits korrigierte
+        drv_corrections = {orig: korr for typ, orig, korr, ok in report if ok and typ == "Fahrer"}
+        car_corrections = {orig: korr for typ, orig, korr, ok in report if ok and typ == "Auto"}
         for i, row in enumerate(rows):
             abs_row = row_from + i
-            car_idx = REL["car"] - REL["driver"]
             drv_val = row[0].strip() if len(row) > 0 else ""
             car_val = row[car_idx].strip() if len(row) > car_idx else ""
             # Endname nach Korrektur bestimmen
-            drv_end = next((r[2] for r in report if r[0]=="Fahrer" and r[1]==drv_val and r[3]), drv_val)
-            car_end = next((r[2] for r in report if r[0]=="Auto"   and r[1]==car_val and r[3]), car_val)
-            if drv_val and drv_end.lower() in driver_map:
-                cell = (abs_row, c_drv)
-                if cell not in all_grey:
-                    all_grey.append(cell)
-            if car_val and car_end.lower() in valid_tabellen:
-                cell = (abs_row, c_car)
-                if cell not in all_grey:
-                    all_grey.append(cell)
-        if all_grey:
-            await run_sync(batch_format_cells, sheet, all_grey, [])
+            drv_end = drv_corrections.get(drv_val, drv_val)
+            car_end = car_corrections.get(car_val, car_val)
+            if drv_val and drv_end.casefold() in driver_map:
+                all_grey.add((abs_row, c_drv))
+            if car_val and car_end.casefold() in valid_tabellen:
+                all_grey.add((abs_row, c_car))
+        # Korrekturen und Grau-Faerbung in einem einzigen spreadsheets.batchUpdate
+        requests = cell_requests(sheet.id, batch_vals, dict.fromkeys(all_grey, GREY2))
+        if requests:
+            await run_sync(sheet.spreadsheet.batch_update, {"requests": requests})
 
         # Alte Warnmeldungen im Channel loeschen wenn Eintrag jetzt korrekt ist
-        corrected_names = {r[1].lower() for r in report if r[3] and r[0] == "Fahrer"}
-        corrected_cars  = {r[1].lower() for r in report if r[3] and r[0] == "Auto"}
-        last_box_msg, _ = await find_last_race_box(channel)
-        async for msg in channel.history(limit=200, after=last_box_msg):
-            if msg.author.id != discord_client.user.id or not msg.content:
-                continue
-            txt_lower = msg.content.lower()
-            should_delete = False
-            if "fahrer nicht in fahrerliste" in txt_lower:
-                if any(name in txt_lower for name in corrected_names):
-                    should_delete = True
-            if "auto" in txt_lower and "nicht erkannt" in txt_lower:
-                if any(car in txt_lower for car in corrected_cars):
-                    should_delete = True
-            if should_delete:
+        corrected_names = {r[1].casefold() for r in report if r[3] and r[0] == "Fahrer"}
+        corrected_cars  = {r[1].casefold() for r in report if r[3] and r[0] == "Auto"}
+        # Ein Muster pro Typ statt einer Substring-Suche pro Name und Nachricht
+        drv_re = re.compile("|".join(map(re.escape, corrected_names))) if corrected_names else None
+        car_re = re.compile("|".join(map(re.escape, corrected_cars)))  if corrected_cars  else None
+        if drv_re or car_re:
+            async for msg in channel.history(limit=200, after=last_box_msg):
+                if msg.author.id != BOT_USER_ID or not msg.content:
+                    continue
+                # Meldungen sind gebuendelt: nur erledigte Zeilen entfernen
+                lines = msg.content.split("\n")
+                keep  = []
+                for line in lines:
+                    txt_lower = line.casefold()
+                    resolved  = False
+                    if drv_re and "fahrer nicht in fahrerliste" in txt_lower:
+                        resolved = drv_re.search(txt_lower) is not None
+                    if car_re and not resolved and "auto" in txt_lower and "nicht erkannt" in txt_lower:
+                        resolved = car_re.search(txt_lower) is not None
+                    if not resolved:
+                        keep.append(line)
+                if len(keep) == len(lines):
+                    continue
                 try:
-                    await msg.delete()
+                    if keep:
+                        await msg.edit(content="\n".join(keep))
+                    else:
+                        await msg.delete()
                 except Exception:
                     pass
 
@@ -1298,14 +1884,17 @@ async def cmd_check(channel):
         await status.edit(content=f"Fehler: {type(e).__name__}: {str(e)[:200]}")
 
 
-async def update_legend(channel, downloaded):
+async def update_legend(channel, downloaded, box=None):
     """Erstellt oder aktualisiert die Legende nach den Screenshots."""
     embed = build_legend_embed(downloaded)
 
     # Vorhandene Legende suchen
-    last_box_msg, _ = await find_last_race_box(channel)
+    # Neueste zuerst: die Legende steht am Ende, Suche endet spaetestens am Race-Kasten
+    last_box_msg, _ = await last_race_box(channel, box)
     existing = None
-    async for msg in channel.history(limit=200, after=last_box_msg):
+    async for msg in channel.history(limit=200):
+        if last_box_msg is not None and msg.id <= last_box_msg.id:
+            break
         if is_legend_embed(msg):
             existing = msg
             break
@@ -1321,54 +1910,48 @@ async def update_legend(channel, downloaded):
     log.info("Legende aktualisiert.")
 
 
-async def cmd_clean(channel):
+async def cmd_clean(channel, box=None):
     """Loescht Bot-Textnachrichten seit dem letzten Race-Kasten.
     Faerbt nur das aktuelle Rennen grau - versiegelte Rennen werden nicht angeruehrt."""
-    last_box_msg, aktuelles_rennen = await find_last_race_box(channel)
+    last_box_msg, aktuelles_rennen = await last_race_box(channel, box)
 
     # Nur Nachrichten NACH dem letzten Race-Kasten loeschen
-    deleted = 0
+    to_delete = []
     async for msg in channel.history(limit=200, after=last_box_msg):
-        if msg.author.id != discord_client.user.id:
+        if msg.author.id != BOT_USER_ID:
             continue
         has_embed = len(msg.embeds) > 0
-        has_image = any(
-            a.content_type and a.content_type.startswith("image/")
-            for a in msg.attachments
-        )
+        has_img   = has_image(msg)
         # Zitat-Posts mit Grid/Retry-Befehlen loeschen (koennen stehenbleiben)
         is_reply_cmd = (
             msg.reference is not None and
-            re.match(r"(grid\s+\w+|retry)", msg.content.strip(), re.IGNORECASE)
+            _REPLY_CMD_RE.match(msg.content.strip())
         )
-        if (not has_embed and not has_image and not is_legend_embed(msg)) or is_reply_cmd:
-            await msg.delete()
-            deleted += 1
-            await asyncio.sleep(0.6)
+        if (not has_embed and not has_img and not is_legend_embed(msg)) or is_reply_cmd:
+            to_delete.append(msg)
+    deleted = await bulk_delete(channel, to_delete)
     log.info(f"cmd_clean: {deleted} Nachrichten geloescht.")
 
     # Nur aktuelles Rennen grau faerben
     if aktuelles_rennen is not None:
-        sheet    = get_sheet()
+        sheet    = await run_sync(get_sheet)
         cs       = col_start(aktuelles_rennen)
-        col_from = rowcol_to_a1(FIRST_DATA_ROW, cs + REL["driver"])[:-len(str(FIRST_DATA_ROW))]
-        col_to   = rowcol_to_a1(FIRST_DATA_ROW, cs + REL["laps"])[:-len(str(FIRST_DATA_ROW))]
+        col_from = rowcol_to_a1(FIRST_DATA_ROW, cs + REL_DRIVER)[:-len(str(FIRST_DATA_ROW))]
+        col_to   = rowcol_to_a1(FIRST_DATA_ROW, cs + REL_LAPS)[:-len(str(FIRST_DATA_ROW))]
         row_end  = FIRST_DATA_ROW + 4 * ROW_OFFSET_PER_GRID - 1
         rng      = f"{col_from}{FIRST_DATA_ROW}:{col_to}{row_end}"
-        sheet.format(rng, {"textFormat": {"foregroundColor": GREY2}})
+        await run_sync(sheet.format, rng, {"textFormat": {"foregroundColor": GREY2}})
         log.info(f"cmd_clean: Rennen {aktuelles_rennen} grau gefaerbt.")
 
 
-async def is_channel_sorted(channel):
+async def is_channel_sorted(channel, box=None):
     """Prueft ob Bot-Screenshots seit dem letzten Rennkasten bereits sortiert sind."""
-    last_box_msg, _ = await find_last_race_box(channel)
+    last_box_msg, _ = await last_race_box(channel, box)
     current_order = []
     async for msg in channel.history(limit=200, after=last_box_msg):
-        if msg.author.id != discord_client.user.id:
+        if msg.author.id != BOT_USER_ID:
             continue
-        has_image = any(a.content_type and a.content_type.startswith("image/")
-                        for a in msg.attachments)
-        if has_image:
+        if has_image(msg):
             meta = parse_screenshot_meta_from_msg(msg)
             if meta:
                 current_order.append(screenshot_sort_key(meta))
@@ -1377,28 +1960,27 @@ async def is_channel_sorted(channel):
     expected = sorted(current_order)
     return current_order == expected
 
-async def cmd_sort(channel):
+async def cmd_sort(channel, box=None):
     """
     Sortiert Bot-Screenshot-Posts nach Grid/Seite seit dem letzten Rennkasten.
     Liest Metadaten aus Reaktions-Emojis. Postet Bilder neu, dann Textnachrichten.
     """
-    last_box_msg, _ = await find_last_race_box(channel)
+    box             = await last_race_box(channel, box)
+    last_box_msg, _ = box
 
     # Alle Bot-Bild-Posts seit dem letzten Rennkasten sammeln
     screenshots = []
     text_msgs   = []
     async for msg in channel.history(limit=200, after=last_box_msg):
-        if msg.author.id != discord_client.user.id:
+        if msg.author.id != BOT_USER_ID:
             continue
-        has_image = any(a.content_type and a.content_type.startswith("image/")
-                        for a in msg.attachments)
-        if has_image:
-            meta = parse_screenshot_meta_from_msg(msg)
+        imgs = image_attachments(msg)
+        if imgs:
+            # Autor (Bot) und Bild sind schon geprueft -> direkt Reaktionen lesen
+            meta = parse_meta_from_reactions(msg.reactions, BOT_USER_ID)
             if meta is None:
                 log.warning(f"Bot-Bild ohne Metadaten-Emojis, ueberspringe: {msg.id}")
                 continue
-            imgs = [a for a in msg.attachments
-                    if a.content_type and a.content_type.startswith("image/")]
             screenshots.append((msg, meta, imgs[0]))
         elif not msg.embeds and msg.content:
             text_msgs.append((msg, msg.content))
@@ -1412,73 +1994,49 @@ async def cmd_sort(channel):
 
     screenshots.sort(key=lambda x: screenshot_sort_key(x[1]))
 
-    # Bilder herunterladen bevor wir loeschen
-    downloaded = []
-    for msg, meta, img_att in screenshots:
-        img_data = await download_attachment(img_att)
-        downloaded.append((msg, meta, img_data))
+    # Bilder parallel herunterladen bevor wir loeschen
+    datas = await asyncio.gather(*(download_attachment(img_att) for _, _, img_att in screenshots))
+    downloaded = [(msg, meta, img_data) for (msg, meta, _), img_data in zip(screenshots, datas)]
 
     # Alle alten Bild-Posts und Textnachrichten loeschen
-    for msg, _, _ in downloaded:
-        try:
-            await msg.delete()
-        except Exception as e:
-            log.warning(f"Konnte Bild-Post nicht loeschen: {e}")
-        await asyncio.sleep(0.7)
-    for msg, _ in text_msgs:
-        try:
-            await msg.delete()
-        except Exception as e:
-            log.warning(f"Konnte Textnachricht nicht loeschen: {e}")
-        await asyncio.sleep(0.7)
+    await bulk_delete(channel, [msg for msg, _, _ in downloaded] + [msg for msg, _ in text_msgs],
+                      "Bild-Post/Textnachricht")
 
     # Bilder in sortierter Reihenfolge neu posten mit Emojis
     for _, meta, img_data in downloaded:
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            tmp_path = f.name
-        try:
-            with open(tmp_path, "wb") as f:
-                f.write(img_data)
-            with open(tmp_path, "rb") as f:
-                img_msg = await channel.send(file=discord.File(f, filename="screenshot.png"))
-            processing_ids.add(img_msg.id)
-            g_emoji, p_emoji = get_marker_emojis(meta["grid"], meta["page"])
-            await img_msg.add_reaction(g_emoji)
-            await img_msg.add_reaction(p_emoji)
-        finally:
-            os.unlink(tmp_path)
-        await asyncio.sleep(0.3)
+        img_msg = await channel.send(
+            file=discord.File(io.BytesIO(img_data), filename="screenshot.png")
+        )
+        processing_ids.add(img_msg.id)
+        g_emoji, p_emoji = get_marker_emojis(meta["grid"], meta["page"])
+        await img_msg.add_reaction(g_emoji)
+        await img_msg.add_reaction(p_emoji)
+        index_screenshot(img_msg.id, meta["grid"], meta["page"])
 
     log.info(f"!sort: {len(screenshots)} Screenshots neu sortiert.")
-    await update_legend(channel, downloaded)
-    # Textnachrichten nach der Legende
+    await update_legend(channel, downloaded, box)
+    # Textnachrichten nach der Legende (Senden bleibt sequentiell wegen Reihenfolge,
+    # Rate-Limits handhabt discord.py selbst)
     text_msgs.reverse()
     for _, content_txt in text_msgs:
         await channel.send(content_txt)
-        await asyncio.sleep(0.3)
 
 
 async def _repost_texts(channel, text_msgs):
     """Hilfsfunktion: Textnachrichten loeschen und ans Ende reposten."""
     text_msgs.reverse()
-    for msg, content_txt in text_msgs:
-        try:
-            await msg.delete()
-        except Exception:
-            pass
+    await bulk_delete(channel, [msg for msg, _ in text_msgs], "Textnachricht")
+    for _, content_txt in text_msgs:
         await channel.send(content_txt)
-        await asyncio.sleep(0.3)
 
 async def cmd_textsort(channel):
     """Sortiert nur Textnachrichten ans Ende (nach dem letzten Race-Kasten)."""
     last_box_msg, _ = await find_last_race_box(channel)
     text_msgs = []
     async for msg in channel.history(limit=200, after=last_box_msg):
-        if msg.author.id != discord_client.user.id:
+        if msg.author.id != BOT_USER_ID:
             continue
-        has_image = any(a.content_type and a.content_type.startswith("image/")
-                        for a in msg.attachments)
-        if not has_image and not msg.embeds and msg.content:
+        if not has_image(msg) and not msg.embeds and msg.content:
             text_msgs.append((msg, msg.content))
     if text_msgs:
         await _repost_texts(channel, text_msgs)
@@ -1489,49 +2047,37 @@ async def pipeline_empty(channel):
     """Prueft ob keine unverarbeiteten User-Screenshots mehr im Channel sind."""
     last_box_msg, _ = await find_last_race_box(channel)
     async for msg in channel.history(limit=100, after=last_box_msg):
-        if msg.author.id == discord_client.user.id:
+        if msg.author.id == BOT_USER_ID:
             continue
-        attachments = [a for a in msg.attachments
-                       if a.content_type and a.content_type.startswith("image/")]
+        attachments = image_attachments(msg)
         if not attachments:
             continue
         # Pruefen ob noch unverarbeitet (kein DONE/ERROR/MANUAL Emoji vom Bot)
-        has_final = False
-        for reaction in msg.reactions:
-            if str(reaction.emoji) in (DONE_EMOJI, ERROR_EMOJI, MANUAL_EMOJI):
-                async for user in reaction.users():
-                    if user.id == discord_client.user.id:
-                        has_final = True
-                        break
-            if has_final:
-                break
+        has_final = any(reaction.me and str(reaction.emoji) in TERMINAL_EMOJIS
+                        for reaction in msg.reactions)
         if not has_final:
             return False  # Noch unverarbeitet
     return True  # Alles erledigt
 
 
 # ── Reaktions-Hilfsfunktionen ─────────────────────────────────────────────────
-async def already_processed(message):
-    try:
-        fresh = await message.channel.fetch_message(message.id)
-    except Exception:
-        return True
-    for reaction in fresh.reactions:
-        if str(reaction.emoji) in (DONE_EMOJI, ERROR_EMOJI, MANUAL_EMOJI):
-            async for user in reaction.users():
-                if user.id == discord_client.user.id:
-                    return True
-    return False
-
-async def get_processed_count(message):
-    fresh = await message.channel.fetch_message(message.id)
+async def get_reaction_state(message):
+    """Liest den Bearbeitungsstand eines Posts mit einem einzigen fetch_message.
+    Gibt (fertig, anzahl_verarbeitet, zahlen_emojis_des_bots) zurueck."""
+    fresh   = await message.channel.fetch_message(message.id)
+    done    = False
+    count   = 0
+    numbers = []
     for reaction in fresh.reactions:
+        if not reaction.me:
+            continue
         emoji_str = str(reaction.emoji)
-        if emoji_str in NUMBER_EMOJIS:
-            async for user in reaction.users():
-                if user.id == discord_client.user.id:
-                    return NUMBER_EMOJIS.index(emoji_str) + 1
-    return 0
+        if emoji_str in TERMINAL_EMOJIS:
+            done = True
+        elif emoji_str in NUMBER_EMOJI_SET:
+            numbers.append(reaction.emoji)
+            count = max(count, NUMBER_EMOJI_INDEX[emoji_str] + 1)
+    return done, count, numbers
 
 async def remove_all_bot_reactions(message):
     """Entfernt alle Bot-Reaktionen von einer Nachricht (fuer Retry)."""
@@ -1539,36 +2085,32 @@ async def remove_all_bot_reactions(message):
         fresh = await message.channel.fetch_message(message.id)
     except Exception:
         return
-    all_emojis = (set(NUMBER_EMOJIS) | ALL_MARKER_EMOJIS |
-                  {DONE_EMOJI, ERROR_EMOJI, MANUAL_EMOJI})
+    all_emojis = (NUMBER_EMOJI_SET | ALL_MARKER_EMOJIS |
+                  TERMINAL_EMOJIS)
     for reaction in fresh.reactions:
-        if str(reaction.emoji) in all_emojis:
-            async for user in reaction.users():
-                if user.id == discord_client.user.id:
-                    try:
-                        await message.remove_reaction(reaction.emoji, discord_client.user)
-                    except Exception as e:
-                        log.warning(f"Konnte Reaktion {reaction.emoji} nicht entfernen: {e}")
+        if reaction.me and str(reaction.emoji) in all_emojis:
+            try:
+                await message.remove_reaction(reaction.emoji, discord_client.user)
+            except Exception as e:
+                log.warning(f"Konnte Reaktion {reaction.emoji} nicht entfernen: {e}")
 
-async def remove_number_reactions(message):
-    fresh     = await message.channel.fetch_message(message.id)
-    to_remove = []
-    for reaction in fresh.reactions:
-        if str(reaction.emoji) in NUMBER_EMOJIS:
-            async for user in reaction.users():
-                if user.id == discord_client.user.id:
-                    to_remove.append(reaction.emoji)
-    for emoji in to_remove:
+async def remove_number_reactions(message, numbers=None):
+    """Entfernt die Zahlen-Reaktionen des Bots. numbers: bereits bekannte Emojis (spart ein fetch)."""
+    if numbers is None:
+        _, _, numbers = await get_reaction_state(message)
+    for emoji in numbers:
         try:
             await message.remove_reaction(emoji, discord_client.user)
         except Exception as e:
             log.warning(f"Konnte Reaktion {emoji} nicht entfernen: {e}")
 
 # ── Screenshot verarbeiten und reposten ──────────────────────────────────────
-async def process_image(message, attachment, grid_override=None, page_override=None):
+async def process_image(message, attachment, grid_override=None, page_override=None,
+                        fresh=False):
     """
     Verarbeitet ein Bild, postet es als Bot-Post und aktualisiert den Race-Kasten.
     grid_override/page_override: manuelle Vorgabe via Reply-Befehl.
+    fresh: gecachte Auswertung ignorieren (Retry).
     Gibt (elapsed, success) zurueck.
     """
     log.info(f"Verarbeite: {attachment.filename} von {message.author}"
@@ -1578,27 +2120,21 @@ async def process_image(message, attachment, grid_override=None, page_override=N
     started = asyncio.get_event_loop().time()
     success = False
     elapsed = 0
-
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        tmp_path = f.name
+    holds_lock = False
 
     global quota_msg  # hier deklarieren, vor allen try/except-Bloecken
 
     try:
         img_data = await download_attachment(attachment)
-        with open(tmp_path, "wb") as f:
-            f.write(img_data)
-
-        processing_ids.add(message.id)  # Verhindert Doppel-Scan waehrend Verarbeitung
 
         # Eine persistente Statusnachricht: entweder neue posten
         # oder bestehende Limit-Nachricht umschreiben
         status_msg = None
         try:
             if quota_msg:
-                await quota_msg.edit(content="Screenshot wird ausgelesen...")
-                status_msg = quota_msg
-                quota_msg  = None
+                # Vor dem await uebernehmen - parallele Bilder greifen sonst dieselbe Nachricht
+                status_msg, quota_msg = quota_msg, None
+                await status_msg.edit(content="Screenshot wird ausgelesen...")
             else:
                 status_msg = await channel.send("Screenshot wird ausgelesen...")
         except Exception:
@@ -1608,14 +2144,32 @@ async def process_image(message, attachment, grid_override=None, page_override=N
                 pass
 
         try:
-            # Gemini-Aufruf in Thread auslagern - Event-Loop bleibt frei fuer Heartbeats
-            data = await asyncio.to_thread(_analyse_image_sync, tmp_path)
+            image_hash = hashlib.sha256(img_data).hexdigest()
+            data       = None if fresh else cached_analysis(image_hash)
+            if data is not None:
+                log.info("Screenshot bereits ausgewertet, verwende gecachtes Ergebnis.")
+            else:
+                # Gemini-Aufruf in Thread auslagern - Event-Loop bleibt frei fuer Heartbeats.
+                # Parallelitaet wird per AIMD an Latenz und 429/5xx angepasst.
+                async with gemini_limiter:
+                    t0 = asyncio.get_event_loop().time()
+                    try:
+                        data = await asyncio.to_thread(_analyse_image_sync, img_data)
+                    except (GeminiQuotaError, ServerError):
+                        gemini_limiter.on_overload()
+                        raise
+                    gemini_limiter.on_success(asyncio.get_event_loop().time() - t0)
+                store_analysis(image_hash, data)
         except Exception:
             # status_msg wird im GeminiQuotaError-Block weiterverwendet,
             # bei anderen Fehlern loeschen
             raise  # Weiterwerfen damit except-Bloecke greifen
 
-        sheet = get_sheet()
+        # Ab hier Sheet und Channel exklusiv (Block-Aufloesung, Duplikate, Race-Kasten)
+        await channel_lock.acquire()
+        holds_lock = True
+
+        sheet = await run_sync(get_sheet)
 
         # Rennnummer aus aktuellem Race-Kasten (nicht aus Screenshot)
         _, aktuelles_rennen = await find_last_race_box(channel)
@@ -1666,13 +2220,17 @@ async def process_image(message, attachment, grid_override=None, page_override=N
             [w if isinstance(w, tuple) else (9, w) for w in warnings],
             key=lambda x: x[0]
         )
-        for _, w in warnings_sorted:
-            await channel.send(w)
+        # Gebuendelt: eine Nachricht statt einer pro Meldung (!check entfernt erledigte Zeilen)
+        for text in chunk_lines([w for _, w in warnings_sorted]):
+            await channel.send(text)
 
-        # Duplikat-Check: nur nach letztem Race-Kasten suchen (versiegelte Rennen nicht anfassen)
+        # Duplikat-Check: Index enthaelt nur Posts nach dem letzten Race-Kasten
+        # (versiegelte Rennen nicht anfassen). Reaktionen koennen per Reply
+        # geaendert worden sein, daher Metadaten vor dem Loeschen pruefen.
         g_emoji, p_emoji = get_marker_emojis(grid_label, page)
-        last_box_for_dup, _ = await find_last_race_box(channel)
-        async for old_msg in channel.history(limit=100, after=last_box_for_dup):
+        dup_id  = _screenshot_index.get((grid_label, page))
+        old_msg = await fetch_indexed(channel, dup_id) if dup_id else None
+        if old_msg is not None:
             old_meta = parse_screenshot_meta_from_msg(old_msg)
             if (old_meta and old_meta["grid"] == grid_label
                     and old_meta["page"] == page):
@@ -1681,14 +2239,15 @@ async def process_image(message, attachment, grid_override=None, page_override=N
                     log.info(f"Duplikat geloescht: Grid {grid_label}, Seite {page}")
                 except Exception as e:
                     log.warning(f"Konnte Duplikat nicht loeschen: {e}")
-                break
 
         # Bild posten, dann Emojis setzen
-        with open(tmp_path, "rb") as f:
-            img_msg = await channel.send(file=discord.File(f, filename="screenshot.png"))
+        img_msg = await channel.send(
+            file=discord.File(io.BytesIO(img_data), filename="screenshot.png")
+        )
         processing_ids.add(img_msg.id)
         await img_msg.add_reaction(g_emoji)
         await img_msg.add_reaction(p_emoji)
+        index_screenshot(img_msg.id, grid_label, page)
 
         # Race-Kasten aktualisieren
         await update_race_box(channel, rennen)
@@ -1701,15 +2260,12 @@ async def process_image(message, attachment, grid_override=None, page_override=N
         retry_time = berlin_time_str(gemini_blocked_until) if gemini_blocked_until else "?"
         text = f"⏳ Gemini-Limit erreicht, versuche es wieder um {retry_time} Uhr."
         # Alte Quota-Nachrichten loeschen (koennen sich bei mehrfachem Limit anhaeufen)
-        async for old_qmsg in channel.history(limit=50):
-            if (old_qmsg.author.id == discord_client.user.id
-                    and old_qmsg.content
-                    and "Gemini-Limit erreicht" in old_qmsg.content
-                    and old_qmsg != quota_msg):
-                try:
-                    await old_qmsg.delete()
-                except Exception:
-                    pass
+        old_qmsgs = [old_qmsg async for old_qmsg in channel.history(limit=50)
+                     if old_qmsg.author.id == BOT_USER_ID
+                     and old_qmsg.content
+                     and "Gemini-Limit erreicht" in old_qmsg.content
+                     and old_qmsg != quota_msg]
+        await bulk_delete(channel, old_qmsgs, "Quota-Nachricht")
         # status_msg in Limit-Nachricht umwandeln statt neue zu posten
         try:
             if status_msg:
@@ -1731,10 +2287,10 @@ async def process_image(message, attachment, grid_override=None, page_override=N
         success = False
 
     finally:
+        if holds_lock:
+            channel_lock.release()
         elapsed = asyncio.get_event_loop().time() - started
-        os.unlink(tmp_path)
 
-    processing_ids.discard(message.id)
     return elapsed, success
 
 # ── Befehls-Handler ───────────────────────────────────────────────────────────
@@ -1751,7 +2307,7 @@ async def cmd_boxupgrade(channel, rennen, freitext=None):
             log.error(f"Konnte Race-Kasten nicht editieren: {e}")
             await channel.send(f"Fehler beim Aktualisieren von Race {rennen:02d}: {e}")
     else:
-        await channel.send(embed=embed)
+        index_race_box(await channel.send(embed=embed))
         log.info(f"Race-Kasten Rennen {rennen} neu erstellt (war nicht vorhanden).")
 
 
@@ -1785,33 +2341,35 @@ STREAMER_ROW  = 5  # Zeile 5 im Grids-Blatt enthaelt Streamer/Hosts
 grid_streamers: set = set()
 
 
+@gspread_retry
 def make_grid_snapshot():
     """Liest Grids-Tabellenblatt aus und erstellt Snapshot."""
     global grid_snapshot, grid_snapshot_done, grid_streamers
     try:
-        wb    = get_workbook()
-        sheet = wb.worksheet("Grids")
+        sheet = get_ws("Grids")
         snapshot  = {}
         streamers = set()
 
-        for grid_label, col in GRID_SNAPSHOT_COLS.items():
+        # Streamer-Zelle (Zeile 5) und Fahrer (Zeilen 6-21) aller Grids in einem Aufruf
+        ranges = []
+        for col in GRID_SNAPSHOT_COLS.values():
             col_letter = rowcol_to_a1(1, col)[:-1]
+            ranges.append(f"{col_letter}{STREAMER_ROW}")
+            ranges.append(f"{col_letter}{GRID_SNAPSHOT_ROWS[0]}:{col_letter}{GRID_SNAPSHOT_ROWS[1]}")
+        results = sheet.batch_get(ranges)
 
-            # Zeile 5: Streamer/Host
-            streamer_val = sheet.cell(STREAMER_ROW, col).value
-            if streamer_val and streamer_val.strip():
-                streamers.add(streamer_val.strip().lower())
+        for i, grid_label in enumerate(GRID_SNAPSHOT_COLS):
+            streamer_val = range_val(results[2 * i], 0, 0)
+            if streamer_val:
+                streamers.add(streamer_val.casefold())
 
-            # Zeilen 6-21: Fahrer
-            vals = sheet.get(
-                f"{col_letter}{GRID_SNAPSHOT_ROWS[0]}:{col_letter}{GRID_SNAPSHOT_ROWS[1]}"
-            )
-            for row in vals:
+            for row in results[2 * i + 1]:
                 name = row[0].strip() if row and row[0].strip() else ""
                 if name:
-                    entry      = driver_map.get(name.lower())
+                    key        = name.casefold()  # Maps sind casefold-gekeyt
+                    entry      = driver_map.get(key)
                     discord_id = entry[2] if entry else None
-                    snapshot[name.lower()] = (grid_label, discord_id)
+                    snapshot[key] = (grid_label, discord_id)
 
         grid_snapshot      = snapshot
         grid_streamers     = streamers
@@ -1845,10 +2403,15 @@ def make_grid_snapshot():
 
         return True
     except Exception as e:
+        if is_gspread_auth_error(e):
+            if not gspread_retrying():
+                raise  # gspread_retry autorisiert neu und wiederholt einmal
+            reset_gspread_cache()
         log.error(f"Grid-Snapshot fehlgeschlagen: {e}")
         return False
 
 
+@gspread_retry
 def check_attendance(rennen):
     """
     Vergleicht Grid-Snapshot mit tatsaechlichen Ergebnissen in Blatt T.
@@ -1865,23 +2428,23 @@ def check_attendance(rennen):
         # Speichern: {name_lower: grid_label} UND {discord_id: grid_label}
         ergebnisse_name = {}
         ergebnisse_id   = {}
+        # Grid-Labels und Fahrerbereiche aller vier Bloecke in einem Aufruf
+        label_ranges = [rowcol_to_a1(*get_grid_label_cell(rennen, block)) for block in range(4)]
+        data_ranges  = [rowcol_to_a1(row_start(block), cs + REL_DRIVER) + ":" +
+                        rowcol_to_a1(row_start(block) + 19, cs + REL_LAPS)
+                        for block in range(4)]
+        results = sheet.batch_get(label_ranges + data_ranges)
         for block in range(4):
-            gl_r, gl_c = get_grid_label_cell(rennen, block)
-            gl_val     = (sheet.cell(gl_r, gl_c).value or "").strip().lower()
+            gl_val = range_val(results[block], 0, 0).lower()
             if not gl_val:
                 continue
-            r_start = row_start(block)
-            rows = sheet.get(
-                rowcol_to_a1(r_start, cs + REL["driver"]) + ":" +
-                rowcol_to_a1(r_start + 19, cs + REL["laps"])
-            )
-            for row in rows:
+            for row in results[4 + block]:
                 name = row[0].strip() if row and row[0].strip() else ""
                 if not name:
                     continue
-                ergebnisse_name[name.lower()] = gl_val
+                ergebnisse_name[name.casefold()] = gl_val
                 # Discord-ID nachschlagen
-                entry = driver_map.get(name.lower())
+                entry = driver_map.get(name.casefold())
                 if entry and entry[2]:
                     ergebnisse_id[entry[2]] = gl_val
 
@@ -1934,6 +2497,10 @@ def check_attendance(rennen):
 
         return falsche_grids, abwesend, unangemeldet
     except Exception as e:
+        if is_gspread_auth_error(e):
+            if not gspread_retrying():
+                raise  # gspread_retry autorisiert neu und wiederholt einmal
+            reset_gspread_cache()
         log.error(f"Anwesenheitspruefung fehlgeschlagen: {e}")
         return [], [], []
 
@@ -2065,172 +2632,174 @@ async def _watch_import(channel, proc, race_str: str):
         log.error(f"DB-Import Ueberwachung fehlgeschlagen: {e}")
 
 
-async def handle_command(message):
-    """Verarbeitet Bot-Befehle. Loescht den User-Post danach."""
-    channel = message.channel
-    content = message.content.strip()
-    parts   = content.split()
-    cmd     = parts[0].lower()
-
+async def _start_race(message, channel, rn, box=None):
+    """Schliesst das laufende Rennen ab (Clean, Sort, Anwesenheit, DB-Import) und postet Race-Kasten rn."""
+    cmd = message.content.split()[0].lower()
     try:
-        if cmd == "!next":
-            _, last_rn = await find_last_race_box(channel)
-            next_rn    = (last_rn + 1) if last_rn else 1
-            try:
-                await message.delete()
-            except Exception:
-                pass
-            if next_rn > 1:
-                await cmd_clean(channel)
-                if not await is_channel_sorted(channel):
-                    log.info("!next: Channel unsortiert, starte !sort")
-                    await cmd_sort(channel)
-                else:
-                    log.info("!next: Channel bereits sortiert, kein !sort noetig")
-                await post_attendance_check(channel, next_rn - 1)
-                # DB-Import fuer abgeschlossenes Rennen triggern
-                await trigger_db_import(channel, race_number=next_rn - 1)
-            embed = discord.Embed(
-                description=f"**Race {next_rn:02d}**",
-                color=0x1a1a2e
-            )
-            await channel.send(embed=embed)
-            log.info(f"!next: Race-Kasten fuer Rennen {next_rn} erstellt.")
-            await check_gemini_version(channel)
-
-        elif cmd == "!race":
-            if len(parts) < 2:
-                await channel.send("Verwendung: !race <Nummer>")
-                return
-            rn = int(parts[1])
-            try:
-                await message.delete()
-            except Exception:
-                pass
-            if rn > 1:
-                await cmd_clean(channel)
-                if not await is_channel_sorted(channel):
-                    log.info("!race: Channel unsortiert, starte !sort")
-                    await cmd_sort(channel)
-                else:
-                    log.info("!race: Channel bereits sortiert, kein !sort noetig")
-                await post_attendance_check(channel, rn - 1)
-                # DB-Import fuer abgeschlossenes Rennen triggern
-                await trigger_db_import(channel, race_number=rn - 1)
-            embed = discord.Embed(
-                description=f"**Race {rn:02d}**",
-                color=0x1a1a2e
-            )
-            await channel.send(embed=embed)
-            log.info(f"!race: Race-Kasten fuer Rennen {rn} erstellt.")
-            await check_gemini_version(channel)
-
-        elif cmd == "!check":
-            await cmd_check(channel)
-
-        elif cmd == "!update":
-            load_car_list()
-            if len(parts) >= 2:
-                rn = int(parts[1])
-                await update_race_box(channel, rn)
-                await channel.send(
-                    f"Fahrzeugliste aktualisiert. Race-Kasten {rn:02d} aktualisiert.",
-                    delete_after=10
-                )
-            else:
-                await channel.send("Fahrzeugliste aktualisiert.", delete_after=10)
+        await message.delete()
+    except Exception:
+        pass
+    if rn > 1:
+        await cmd_clean(channel, box)
+        if not await is_channel_sorted(channel, box):
+            log.info(f"{cmd}: Channel unsortiert, starte !sort")
+            await cmd_sort(channel, box)
+        else:
+            log.info(f"{cmd}: Channel bereits sortiert, kein !sort noetig")
+        await post_attendance_check(channel, rn - 1)
+        # DB-Import fuer abgeschlossenes Rennen triggern
+        await trigger_db_import(channel, race_number=rn - 1)
+    embed = discord.Embed(
+        description=f"**Race {rn:02d}**",
+        color=0x1a1a2e
+    )
+    index_race_box(await channel.send(embed=embed))
+    log.info(f"{cmd}: Race-Kasten fuer Rennen {rn} erstellt.")
+    await check_gemini_version(channel)
+
+async def _handle_next(message, channel, parts):
+    box     = await find_last_race_box(channel)
+    last_rn = box[1]
+    await _start_race(message, channel, (last_rn + 1) if last_rn else 1, box)
+
+async def _handle_race(message, channel, parts):
+    if len(parts) < 2:
+        await channel.send("Verwendung: !race <Nummer>")
+        return
+    await _start_race(message, channel, int(parts[1]))
 
-        elif cmd == "!sort":
-            await cmd_sort(channel)
-            await channel.send("Screenshots sortiert.", delete_after=5)
+async def _handle_check(message, channel, parts):
+    await cmd_check(channel)
 
-        elif cmd == "!textsort":
-            await cmd_textsort(channel)
+async def _handle_update(message, channel, parts):
+    global driver_map, gt7_name_map, discord_id_map
+    driver_map, gt7_name_map, discord_id_map = await reload_lists(force=True)
+    if len(parts) >= 2:
+        rn = int(parts[1])
+        await update_race_box(channel, rn)
+        await channel.send(
+            f"Fahrzeugliste aktualisiert. Race-Kasten {rn:02d} aktualisiert.",
+            delete_after=10
+        )
+    else:
+        await channel.send("Fahrzeugliste aktualisiert.", delete_after=10)
 
-        elif cmd == "!clean":
-            await cmd_clean(channel)
+async def _handle_sort(message, channel, parts):
+    await cmd_sort(channel)
+    await channel.send("Screenshots sortiert.", delete_after=5)
 
-        elif cmd == "!boxupgrade":
-            if len(parts) < 2:
-                await channel.send("Verwendung: !boxupgrade <Rennen> [Freitext]")
-                return
-            rn       = int(parts[1])
-            freitext = " ".join(parts[2:]) if len(parts) > 2 else None
-            await cmd_boxupgrade(channel, rn, freitext)
+async def _handle_textsort(message, channel, parts):
+    await cmd_textsort(channel)
 
-        elif cmd == "!snapshot":
-            try:
-                with open(SNAPSHOT_FILE, "r", encoding="utf-8") as f:
-                    txt = f.read()
-                # Discord-Nachrichtenlimit beachten
-                if len(txt) > 1900:
-                    txt = txt[:1900] + "\n..."
-                await channel.send(f"```\n{txt}\n```")
-            except FileNotFoundError:
-                await channel.send("Kein Snapshot vorhanden.")
-            except Exception as e:
-                await channel.send(f"Fehler beim Laden des Snapshots: {e}")
-
-        elif cmd == "!dbimport":
-            # !dbimport           → aktive Saison, alle Rennen
-            # !dbimport 3         → aktive Saison, nur Rennen 3
-            # !dbimport --season 12     → Saison 12, alle Rennen
-            # !dbimport --season 12 3  → Saison 12, Rennen 3
-            import_args = ["python3", IMPORT_SCRIPT]
-            race_num = None
-            season_id = None
-            rest = parts[1:]
-            i = 0
-            while i < len(rest):
-                if rest[i] == "--season" and i + 1 < len(rest):
-                    season_id = rest[i + 1]
-                    i += 2
-                elif rest[i].isdigit():
-                    race_num = rest[i]
-                    i += 1
-                else:
-                    i += 1
-            if season_id:
-                import_args += ["--season", season_id]
-            if race_num:
-                import_args += ["--race", race_num]
-            race_str = (f"Saison {season_id or 'aktiv'}"
-                        + (f", Rennen {race_num}" if race_num else ", alle Rennen"))
-            await channel.send(f"⏳ DB-Import gestartet ({race_str})…")
-            try:
-                proc = await asyncio.create_subprocess_exec(
-                    *import_args,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.STDOUT,
-                )
-                asyncio.create_task(_watch_import(channel, proc, race_str))
-            except Exception as e:
-                await channel.send(f"❌ Fehler beim Starten: {e}")
-
-        elif cmd == "!help":
-            lines = [
-                "**RaceResultBot – Befehle**",
-                "",
-                "**!next** – Nächstes Rennen starten (Race-Kasten ++, Clean, Sort falls nötig)",
-                "**!race X** – Rennen X starten (Race-Kasten auf X setzen, Clean, Sort falls nötig)",
-                "**!sort** – Screenshots nach Grid/Seite sortieren",
-                "**!textsort** – Nur Textnachrichten ans Ende sortieren",
-                "**!clean** – Bot-Nachrichten seit letztem Race-Kasten bereinigen, aktuelles Rennen grau färben",
-                "**!check** – Fahrer und Fahrzeuge validieren, Korrekturen vornehmen",
-                "**!update [X]** – Fahrzeugliste neu laden; optional Race-Kasten X aktualisieren",
-                "**!boxupgrade X [Freitext]** – Race-Kasten X aus Tabellendaten neu generieren (Strafen, Korrekturen)",
-                "**!snapshot** – Aktuellen Grid-Snapshot anzeigen (Anmeldungen zum Rennen)",
-                "**!dbimport [--season X] [Rennen]** – DB-Import manuell starten (z.B. !dbimport 3 oder !dbimport --season 12)",
-                "",
-                "**Reply auf Screenshot mit 'Grid X Seite Y'** – Screenshot mit manuellen Werten verarbeiten",
-                "**Reply auf Screenshot mit 'Grid X'** – Screenshot verarbeiten (nur wenn Gemini verfügbar)",
-                "**Reply auf Screenshot mit 'Retry'** – Alle Bot-Reaktionen entfernen, Screenshot erneut auslesen",
-            ]
-            await channel.send("\n".join(lines))
+async def _handle_clean(message, channel, parts):
+    await cmd_clean(channel)
 
+async def _handle_boxupgrade(message, channel, parts):
+    if len(parts) < 2:
+        await channel.send("Verwendung: !boxupgrade <Rennen> [Freitext]")
+        return
+    rn       = int(parts[1])
+    freitext = " ".join(parts[2:]) if len(parts) > 2 else None
+    await cmd_boxupgrade(channel, rn, freitext)
+
+def read_snapshot_file():
+    with open(SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+        return f.read()
+
+async def _handle_snapshot(message, channel, parts):
+    try:
+        txt = await run_sync(read_snapshot_file)
+        # Discord-Nachrichtenlimit beachten
+        if len(txt) > 1900:
+            txt = txt[:1900] + "\n..."
+        await channel.send(f"```\n{txt}\n```")
+    except FileNotFoundError:
+        await channel.send("Kein Snapshot vorhanden.")
+    except Exception as e:
+        await channel.send(f"Fehler beim Laden des Snapshots: {e}")
+
+async def _handle_dbimport(message, channel, parts):
+    # !dbimport           → aktive Saison, alle Rennen
+    # !dbimport 3         → aktive Saison, nur Rennen 3
+    # !dbimport --season 12     → Saison 12, alle Rennen
+    # !dbimport --season 12 3  → Saison 12, Rennen 3
+    import_args = ["python3", IMPORT_SCRIPT]
+    race_num = None
+    season_id = None
+    rest = parts[1:]
+    i = 0
+    while i < len(rest):
+        if rest[i] == "--season" and i + 1 < len(rest):
+            season_id = rest[i + 1]
+            i += 2
+        elif rest[i].isdigit():
+            race_num = rest[i]
+            i += 1
         else:
-            return
+            i += 1
+    if season_id:
+        import_args += ["--season", season_id]
+    if race_num:
+        import_args += ["--race", race_num]
+    race_str = (f"Saison {season_id or 'aktiv'}"
+                + (f", Rennen {race_num}" if race_num else ", alle Rennen"))
+    await channel.send(f"⏳ DB-Import gestartet ({race_str})…")
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *import_args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        asyncio.create_task(_watch_import(channel, proc, race_str))
+    except Exception as e:
+        await channel.send(f"❌ Fehler beim Starten: {e}")
+
+HELP_LINES = [
+    "**RaceResultBot – Befehle**",
+    "",
+    "**!next** – Nächstes Rennen starten (Race-Kasten ++, Clean, Sort falls nötig)",
+    "**!race X** – Rennen X starten (Race-Kasten auf X setzen, Clean, Sort falls nötig)",
+    "**!sort** – Screenshots nach Grid/Seite sortieren",
+    "**!textsort** – Nur Textnachrichten ans Ende sortieren",
+    "**!clean** – Bot-Nachrichten seit letztem Race-Kasten bereinigen, aktuelles Rennen grau färben",
+    "**!check** – Fahrer und Fahrzeuge validieren, Korrekturen vornehmen",
+    "**!update [X]** – Fahrzeugliste neu laden; optional Race-Kasten X aktualisieren",
+    "**!boxupgrade X [Freitext]** – Race-Kasten X aus Tabellendaten neu generieren (Strafen, Korrekturen)",
+    "**!snapshot** – Aktuellen Grid-Snapshot anzeigen (Anmeldungen zum Rennen)",
+    "**!dbimport [--season X] [Rennen]** – DB-Import manuell starten (z.B. !dbimport 3 oder !dbimport --season 12)",
+    "",
+    "**Reply auf Screenshot mit 'Grid X Seite Y'** – Screenshot mit manuellen Werten verarbeiten",
+    "**Reply auf Screenshot mit 'Grid X'** – Screenshot verarbeiten (nur wenn Gemini verfügbar)",
+    "**Reply auf Screenshot mit 'Retry'** – Alle Bot-Reaktionen entfernen, Screenshot erneut auslesen",
+]
+
+async def _handle_help(message, channel, parts):
+    await channel.send("\n".join(HELP_LINES))
+
+COMMANDS = {
+    "!next":       _handle_next,
+    "!race":       _handle_race,
+    "!check":      _handle_check,
+    "!update":     _handle_update,
+    "!sort":       _handle_sort,
+    "!textsort":   _handle_textsort,
+    "!clean":      _handle_clean,
+    "!boxupgrade": _handle_boxupgrade,
+    "!snapshot":   _handle_snapshot,
+    "!dbimport":   _handle_dbimport,
+    "!help":       _handle_help,
+}
+
+async def handle_command(message):
+    """Verarbeitet Bot-Befehle. Loescht den User-Post danach."""
+    channel = message.channel
+    parts   = message.content.strip().split()
+    cmd     = parts[0].lower()
+    handler = COMMANDS.get(cmd)
 
+    try:
+        if handler is not None:
+            await handler(message, channel, parts)
     except Exception as e:
         log.error(f"Fehler bei Befehl '{cmd}': {e}", exc_info=True)
         await channel.send(f"Fehler bei {cmd}: {str(e)[:200]}")
@@ -2240,7 +2809,6 @@ async def handle_command(message):
         except Exception:
             pass
 
-
 async def handle_reply(message):
     """Verarbeitet Antworten auf Screenshots: 'Grid X [Seite Y]' oder 'Retry'."""
     channel = message.channel
@@ -2253,8 +2821,7 @@ async def handle_reply(message):
         return
 
     # Nur auf Posts mit Bildern reagieren
-    attachments = [a for a in ref_msg.attachments
-                   if a.content_type and a.content_type.startswith("image/")]
+    attachments = image_attachments(ref_msg)
     if not attachments:
         return
 
@@ -2262,18 +2829,21 @@ async def handle_reply(message):
     if text.lower() == "retry":
         await remove_all_bot_reactions(ref_msg)
         processing_ids.discard(ref_msg.id)
+        finished_ids.discard(ref_msg.id)
         log.info(f"Retry: Alle Bot-Reaktionen von {ref_msg.id} entfernt.")
         try:
             await message.delete()
         except Exception:
             pass
+        if ref_msg.author.id != BOT_USER_ID:
+            if gemini_is_blocked():
+                schedule_resume(channel, ref_msg)
+            else:
+                await process_screenshot_message(ref_msg, fresh=True)
         return
 
     # --- Grid X [Seite Y] ---
-    m = re.match(
-        r"grid\s+(\w+)(?:\s+seite\s+(\d+))?",
-        text, re.IGNORECASE
-    )
+    m = _GRID_REPLY_RE.match(text)
     if not m:
         return
 
@@ -2316,18 +2886,22 @@ async def handle_reply(message):
         attachment = attachments[0]
         processing_ids.add(ref_msg.id)
         log.info(f"Manueller Override: Grid {grid_override} Seite {page_override}")
-        _, success = await process_image(
-            ref_msg, attachment,
-            grid_override=grid_override,
-            page_override=page_override
-        )
+        try:
+            _, success = await process_image(
+                ref_msg, attachment,
+                grid_override=grid_override,
+                page_override=page_override
+            )
+        finally:
+            processing_ids.discard(ref_msg.id)
         if success is True:
             try:
                 await ref_msg.delete()
                 log.info("Original-Post nach manuellem Override geloescht.")
             except Exception:
                 pass
-            await cmd_sort(channel)
+            async with channel_lock:
+                await cmd_sort(channel)
 
     try:
         await message.delete()
@@ -2341,7 +2915,180 @@ intents.reactions       = True
 
 discord_client = discord.Client(intents=intents)
 
-async def scan_channel():
+# Task der nach Ablauf der Gemini-Sperre liegengebliebene Screenshots nachholt
+_resume_task  = None
+# Neueste gesehene Message-ID (Abgleich und on_message; None = letzte 50 Nachrichten)
+_sweep_after  = None
+# Aelteste zurueckgestellte Message-ID - 1 (naechster Abgleich beginnt hier)
+_resume_from  = None
+# on_ready bereits einmal gelaufen (Start-Ablauf nicht wiederholen)
+_started      = False
+
+def is_image(attachment):
+    ct = attachment.content_type
+    return bool(ct) and ct.startswith("image/")
+
+def has_image(message):
+    return any(is_image(a) for a in message.attachments)
+
+def image_attachments(message):
+    return [a for a in message.attachments if is_image(a)]
+
+async def process_screenshot_message(message, fresh=False):
+    """Verarbeitet alle noch offenen Bilder eines User-Posts nacheinander.
+    fresh: Bilder neu auswerten statt gecachte Gemini-Ergebnisse zu nutzen (Retry)."""
+    if message.id in processing_ids or message.id in finished_ids:
+        return
+    attachments = image_attachments(message)
+    if not attachments:
+        return
+    # Post fuer die gesamte Verarbeitung aller Bilder beanspruchen - vor dem ersten
+    # await, sonst kann ein paralleler Abgleich zwischen zwei Bildern dazwischenfunken
+    processing_ids.add(message.id)
+    try:
+        await _process_screenshot_images(message, attachments, fresh)
+    finally:
+        processing_ids.discard(message.id)
+
+async def _process_screenshot_images(message, attachments, fresh):
+    """Kern von process_screenshot_message; laeuft nur mit beanspruchtem Post."""
+    try:
+        done, processed_count, numbers = await get_reaction_state(message)
+    except Exception as e:
+        log.warning(f"Reaktionen nicht lesbar, ueberspringe: {e}")
+        return
+    if done:
+        finished_ids.add(message.id)
+        return
+
+    total = len(attachments)
+    while processed_count < total:
+        if gemini_is_blocked():
+            schedule_resume(message.channel, message)
+            return
+        elapsed, success = await process_image(message, attachments[processed_count],
+                                               fresh=fresh)
+
+        if success is None:
+            # Quota -> kein Emoji, nach Ablauf der Sperre erneut versuchen
+            schedule_resume(message.channel, message)
+            return
+
+        if success is False:
+            await remove_number_reactions(message, numbers)
+            await message.add_reaction(ERROR_EMOJI)
+            finished_ids.add(message.id)
+            # textsort auch bei Fehler wenn Pipeline leer
+            async with channel_lock:
+                if await pipeline_empty(message.channel):
+                    await cmd_textsort(message.channel)
+            return
+
+        processed_count += 1
+        await remove_number_reactions(message, numbers)
+        numbers = []
+        if processed_count >= total:
+            finished_ids.add(message.id)
+            # Alle Bilder fertig: Original-Post loeschen
+            try:
+                await message.delete()
+                log.info("Original-Post geloescht.")
+            except Exception as e:
+                log.warning(f"Konnte Original-Post nicht loeschen: {e}")
+            # textsort wenn keine weiteren Screenshots in der Pipeline
+            async with channel_lock:
+                if await pipeline_empty(message.channel):
+                    await cmd_textsort(message.channel)
+            return
+
+        numbers = [NUMBER_EMOJIS[processed_count - 1]]
+        await message.add_reaction(numbers[0])
+        log.info(f"Bild {processed_count}/{total} verarbeitet.")
+        remaining = IMAGE_INTERVAL - elapsed
+        if remaining > 0:
+            log.info(f"Warte {remaining:.1f}s")
+            await asyncio.sleep(remaining)
+
+async def dispatch_message(message):
+    """Leitet eine User-Nachricht an Befehl, Reply-Befehl oder Screenshot-Verarbeitung weiter.
+    Befehle laufen exklusiv, Screenshots parallel (Sheet-Teil sperrt selbst)."""
+    if message.content.startswith("!"):
+        async with channel_lock:
+            await handle_command(message)
+    elif message.reference and _REPLY_CMD_RE.match(message.content.strip()):
+        await handle_reply(message)
+    elif image_attachments(message):
+        if gemini_is_blocked():
+            log.info("Gemini gesperrt, Screenshot wird nach Ablauf der Sperre verarbeitet.")
+            schedule_resume(message.channel, message)
+            return
+        await process_screenshot_message(message)
+
+async def sweep_channel(channel, limit=50, initial=False):
+    """Abgleich: verarbeitet alles, was ohne Event liegen geblieben ist
+    (Start, Reconnect, nach Gemini-Sperre).
+    initial: Start-Abgleich - immer die letzten `limit` Nachrichten, auch wenn
+    on_message schon vorher eine Nachricht gesehen hat."""
+    global _sweep_after, _resume_from
+    seen  = _sweep_after  # bis hier bereits live per on_message gesehen
+    start = None if initial else seen
+    if _resume_from is not None:
+        start = _resume_from if start is None else min(_resume_from, start)
+    _resume_from = None
+    if start is not None:
+        # Inkrementell: alles nach dem Startpunkt, ohne Obergrenze (sonst fiele
+        # der zurueckgestellte Post bei vielen neueren Nachrichten aus dem Fenster)
+        history = channel.history(limit=None, after=discord.Object(id=start),
+                                  oldest_first=True)
+    else:
+        history = channel.history(limit=limit)
+    messages = [message async for message in history]
+    if start is None:
+        messages.reverse()  # aelteste zuerst
+    if messages:
+        _sweep_after = max(_sweep_after or 0, max(m.id for m in messages))
+    pending = [m for m in messages if m.author.id != BOT_USER_ID]
+    # Befehle und Replies der Reihe nach, danach alle Screenshots parallel.
+    # Bereits live gesehene Befehle/Replies nicht noch einmal ausfuehren.
+    screenshots = []
+    for message in pending:
+        if (message.content.startswith("!") or message.reference
+                or not image_attachments(message)):
+            if seen is None or message.id > seen:
+                await dispatch_message(message)
+        else:
+            screenshots.append(message)
+    if screenshots:
+        results = await asyncio.gather(
+            *(dispatch_message(m) for m in screenshots), return_exceptions=True
+        )
+        for m, res in zip(screenshots, results):
+            if isinstance(res, Exception):
+                log.error(f"Abgleich: Screenshot {m.id} fehlgeschlagen: {res}")
+
+def schedule_resume(channel, message=None):
+    """Startet (einmalig) den Task, der nach Ablauf der Gemini-Sperre nachverarbeitet.
+    message: zurueckgestellter Post - der naechste Abgleich beginnt spaetestens dort."""
+    global _resume_task, _resume_from
+    if message is not None:
+        marker       = message.id - 1
+        _resume_from = marker if _resume_from is None else min(_resume_from, marker)
+    if _resume_task is None or _resume_task.done():
+        _resume_task = asyncio.create_task(_resume_after_block(channel))
+
+async def _resume_after_block(channel):
+    while (remaining := gemini_is_blocked()):
+        rest = (f"{remaining:.0f} Sekunden" if remaining < 120
+                else f"{remaining / 60:.0f} Minuten")
+        log.info(f"Gemini gesperrt, Bild-Verarbeitung pausiert. Noch ca. {rest}.")
+        await asyncio.sleep(min(max(remaining, 1), 600))
+    await clear_quota_msg(channel)
+    try:
+        await sweep_channel(channel)
+    except Exception as e:
+        log.error(f"Nachverarbeitung nach Gemini-Sperre fehlgeschlagen: {e}", exc_info=True)
+
+async def startup_sweep():
     await discord_client.wait_until_ready()
     channel = discord_client.get_channel(DISCORD_CHANNEL_ID)
 
@@ -2349,120 +3096,51 @@ async def scan_channel():
         log.error(f"Channel {DISCORD_CHANNEL_ID} nicht gefunden!")
         return
 
-    log.info(f"Scanne #{channel.name} alle {POLL_INTERVAL}s | GEMINI_2ND_RUN={GEMINI_2ND_RUN}")
+    log.info(f"Ueberwache #{channel.name} | GEMINI_2ND_RUN={GEMINI_2ND_RUN}")
 
-    # Beim Start: Race 01 erstellen falls noch kein Rennkasten vorhanden
+    # Beim Start: Race-Kasten-Index fuellen, Race 01 erstellen falls noch keiner vorhanden
+    await hydrate_race_box_index(channel)
     _, existing_rn = await find_last_race_box(channel)
     if existing_rn is None:
         embed = discord.Embed(description="**Race 01**", color=0x1a1a2e)
-        await channel.send(embed=embed)
+        index_race_box(await channel.send(embed=embed))
         log.info("Erster Race-Kasten (Race 01) erstellt.")
         await check_gemini_version(channel)
 
-    while not discord_client.is_closed():
-        try:
-            if gemini_is_blocked():
-                mins = int((gemini_blocked_until - datetime.now()).total_seconds() / 60)
-                log.info(f"Gemini gesperrt, ueberspringe Bild-Scan. Noch ca. {mins} Minuten.")
-                # Befehle trotzdem verarbeiten (kein Gemini noetig)
-                async for message in channel.history(limit=20):
-                    if message.author.id == discord_client.user.id:
-                        continue
-                    if (message.content.startswith("!")):
-                        await handle_command(message)
-                    elif (message.reference and
-                          re.match(r"(grid\s+\w+|retry)", message.content.strip(), re.IGNORECASE)):
-                        await handle_reply(message)
-                # Sperre aufgehoben?
-                if not gemini_is_blocked():
-                    await clear_quota_msg(channel)
-                await asyncio.sleep(POLL_INTERVAL)
-                continue
-
-            async for message in channel.history(limit=50):
-
-                # Nur Nicht-Bot-Nachrichten verarbeiten
-                if message.author.id == discord_client.user.id:
-                    continue
-
-                # Befehle verarbeiten
-                if message.content.startswith("!"):
-                    await handle_command(message)
-                    continue
-
-                # Reply-Befehle verarbeiten (Grid X [Seite Y] oder Retry)
-                if (message.reference and
-                        re.match(r"(grid\s+\w+|retry)", message.content.strip(), re.IGNORECASE)):
-                    await handle_reply(message)
-                    continue
-
-                # Nur fremde Posts mit Bildern auslesen
-                if message.id in processing_ids:
-                    continue
-
-                attachments = [
-                    a for a in message.attachments
-                    if a.content_type and a.content_type.startswith("image/")
-                ]
-                if not attachments:
-                    continue
-                if await already_processed(message):
-                    continue
-
-                try:
-                    processed_count = await get_processed_count(message)
-                except Exception as e:
-                    log.warning(f"Reaktionen nicht lesbar, ueberspringe: {e}")
-                    continue
-
-                total      = len(attachments)
-                next_index = processed_count
-                if next_index >= total:
-                    continue
-
-                attachment = attachments[next_index]
-                if message.id in processing_ids:
-                    continue  # Doppelcheck direkt vor dem Aufruf
-                processing_ids.add(message.id)  # Vor dem Aufruf eintragen - verhindert Doppel-Scan
-                elapsed, success = await process_image(message, attachment)
-
-                if gemini_is_blocked():
-                    break
+    try:
+        await sweep_channel(channel, initial=True)
+    except Exception as e:
+        log.error(f"Start-Abgleich fehlgeschlagen: {e}", exc_info=True)
 
-                if success is True:
-                    new_count = processed_count + 1
-                    await remove_number_reactions(message)
-                    if new_count >= total:
-                        # Alle Bilder fertig: Original-Post loeschen
-                        try:
-                            await message.delete()
-                            log.info("Original-Post geloescht.")
-                        except Exception as e:
-                            log.warning(f"Konnte Original-Post nicht loeschen: {e}")
-                        # textsort wenn keine weiteren Screenshots in der Pipeline
-                        if await pipeline_empty(channel):
-                            await cmd_textsort(channel)
-                    else:
-                        await message.add_reaction(NUMBER_EMOJIS[new_count - 1])
-                        log.info(f"Bild {new_count}/{total} verarbeitet.")
-                elif success is False:
-                    await remove_number_reactions(message)
-                    await message.add_reaction(ERROR_EMOJI)
-                    # textsort auch bei Fehler wenn Pipeline leer
-                    if await pipeline_empty(channel):
-                        await cmd_textsort(channel)
-                # success is None -> Quota, kein Emoji
-
-                remaining = POLL_INTERVAL - elapsed
-                if remaining > 0:
-                    log.info(f"Warte {remaining:.1f}s")
-                    await asyncio.sleep(remaining)
-                continue  # Kein zusaetzliches Sleep am Ende
+async def reconnect_sweep():
+    """Nach neuer Gateway-Session: waehrend der Trennung verpasste Nachrichten nachholen
+    (inkrementell ab _sweep_after, kein erneuter Start-Ablauf)."""
+    channel = discord_client.get_channel(DISCORD_CHANNEL_ID)
+    if channel is None:
+        return
+    try:
+        await sweep_channel(channel)
+    except Exception as e:
+        log.error(f"Abgleich nach Reconnect fehlgeschlagen: {e}", exc_info=True)
 
-        except Exception as e:
-            log.error(f"Scan-Fehler: {e}", exc_info=True)
+@discord_client.event
+async def on_message(message):
+    global _sweep_after
+    if message.channel.id != DISCORD_CHANNEL_ID:
+        return
+    # Jede Channel-Nachricht (auch eigene) gilt als gesehen - Abgleiche starten danach
+    _sweep_after = max(_sweep_after or 0, message.id)
+    if message.author.id == BOT_USER_ID:
+        return
+    try:
+        await dispatch_message(message)
+    except Exception as e:
+        log.error(f"Fehler bei Nachricht {message.id}: {e}", exc_info=True)
 
-        await asyncio.sleep(POLL_INTERVAL)
+@discord_client.event
+async def on_raw_message_delete(payload):
+    if payload.channel_id == DISCORD_CHANNEL_ID:
+        unindex_message(payload.message_id)
 
 # ── Webserver (Render keep-alive) ─────────────────────────────────────────────
 from aiohttp import web
@@ -2482,10 +3160,16 @@ async def start_webserver():
 
 @discord_client.event
 async def on_ready():
-    global driver_map, gt7_name_map, discord_id_map
+    global driver_map, gt7_name_map, discord_id_map, BOT_USER_ID, _started
+    BOT_USER_ID = discord_client.user.id
     log.info(f"Eingeloggt als {discord_client.user}")
-    load_car_list()  # laedt auch Car_Translate
-    driver_map, gt7_name_map, discord_id_map = load_driver_list()
+    # on_ready feuert auch nach jeder neuen Session - dann nur nachholen,
+    # Listen/Index/Scheduler laufen bereits
+    if _started:
+        discord_client.loop.create_task(reconnect_sweep())
+        return
+    _started = True
+    driver_map, gt7_name_map, discord_id_map = await reload_lists()  # inkl. Car_Translate
     if not car_list:
         channel = discord_client.get_channel(DISCORD_CHANNEL_ID)
         if channel:
@@ -2493,7 +3177,7 @@ async def on_ready():
                 "⚠️ Fahrzeugliste konnte nicht geladen werden (DB_Tech, Spalte R ab Zeile 8). "
                 "Fahrzeugnamen werden nicht uebersetzt. Bitte !update ausfuehren nach Pruefung."
             )
-    discord_client.loop.create_task(scan_channel())
+    discord_client.loop.create_task(startup_sweep())
     discord_client.loop.create_task(snapshot_scheduler())
 
 async def main():
@@ -0,0 +1,72 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+for dep in ("discord", "gspread", "pymysql", "google.generativeai", "PIL"):
+    pytest.importorskip(dep)
+
+# bot.py liest seine Konfiguration beim Import
+for key in ("DISCORD_TOKEN", "GEMINI_API_KEY", "GOOGLE_CREDENTIALS",
+            "DB_HOST", "DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(key, "test")
+os.environ.setdefault("DISCORD_CHANNEL_ID", "1")
+
+import bot  # noqa: E402
+
+
+def make_message(msg_id, n_images):
+    """Minimaler User-Post mit n Bild-Anhaengen; Zahlen-Reaktionen werden mitgezaehlt."""
+    state = {"count": 0}
+
+    async def add_reaction(emoji):
+        if emoji in bot.NUMBER_EMOJI_INDEX:
+            state["count"] = bot.NUMBER_EMOJI_INDEX[emoji] + 1
+
+    async def delete():
+        pass
+
+    attachments = [SimpleNamespace(content_type="image/png", filename=f"{i}.png")
+                   for i in range(n_images)]
+    message = SimpleNamespace(id=msg_id, attachments=attachments, channel=object(),
+                              add_reaction=add_reaction, delete=delete)
+    return message, state
+
+
+def test_concurrent_calls_process_each_image_once(monkeypatch):
+    message, state = make_message(4242, 2)
+    calls = []
+
+    async def fake_process_image(msg, attachment, grid_override=None,
+                                 page_override=None, fresh=False):
+        calls.append(attachment.filename)
+        await asyncio.sleep(0.01)
+        return 0.0, True
+
+    async def fake_reaction_state(msg):
+        return False, state["count"], []
+
+    async def nothing(*args, **kwargs):
+        return None
+
+    async def not_empty(channel):
+        return False
+
+    monkeypatch.setattr(bot, "process_image", fake_process_image)
+    monkeypatch.setattr(bot, "get_reaction_state", fake_reaction_state)
+    monkeypatch.setattr(bot, "remove_number_reactions", nothing)
+    monkeypatch.setattr(bot, "pipeline_empty", not_empty)
+    monkeypatch.setattr(bot, "gemini_is_blocked", lambda: None)
+    monkeypatch.setattr(bot, "IMAGE_INTERVAL", 0.02)
+
+    async def run():
+        monkeypatch.setattr(bot, "channel_lock", asyncio.Lock())
+        await asyncio.gather(bot.process_screenshot_message(message),
+                             bot.process_screenshot_message(message))
+
+    asyncio.run(run())
+
+    assert len(calls) == 2
+    assert calls == ["0.png", "1.png"]
+    assert message.id not in bot.processing_ids